@@ -1,14 +1,66 @@
+import asyncio
+import io
+
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 
-from app.models.feedback import AIInsight, AIInsightWithUserAnalysis
+from app.agents.llm_provider import structured_output
+from app.agents.response_cache import ResponseCache, make_cache_key
+from app.models.feedback import (
+    AIInsight,
+    AIInsightBatch,
+    AIInsightWithUserAnalysis,
+    AIInsightWithUserAnalysisBatch,
+)
 from app.models.prompts import CategoryDefinition, FewShotExample
 
 
+def _render_prefix(
+    categories: list[CategoryDefinition], few_shots: list[FewShotExample]
+) -> str:
+    """Render the category and few-shot blocks, which repeat across articles."""
+    buf = io.StringIO()
+    buf.write("## Category Definitions\n")
+
+    buf.write(
+        "CRITICAL: Category names may be arbitrary or misleading. "
+        "You MUST classify based ONLY on the definition text, NOT the category name. "
+        "Match the news content against each definition and select the category "
+        "whose DEFINITION best describes the content.\n\n"
+    )
+
+    for cat in categories:
+        buf.write(f"### {cat.name}\n")
+        buf.write(f"**Definition (use this for classification):** {cat.definition}\n\n")
+
+    buf.write("Allowed category names for output (must match exactly):\n")
+    for cat in categories:
+        buf.write(f"- {cat.name}\n")
+
+    if few_shots:
+        buf.write("\n## Examples\n")
+        for ex in few_shots:
+            buf.write(f"**News:** {ex.news_content}\n")
+            buf.write(f"**Category:** {ex.category}\n")
+            buf.write(f"**Reasoning:** {ex.reasoning}\n\n")
+
+    return buf.getvalue()
+
+
 class AnalysisAgent:
-    def __init__(self, llm: BaseChatModel, system_prompt: str):
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        system_prompt: str,
+        cache: ResponseCache[AIInsight | AIInsightWithUserAnalysis] | None = None,
+        batch_size: int = 8,
+        max_concurrency: int = 4,
+    ):
         self.llm = llm
         self.system_prompt = system_prompt
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
 
     def analyze(
         self,
@@ -17,31 +69,138 @@ class AnalysisAgent:
         article_content: str,
         custom_system_prompt: str | None = None,
     ) -> AIInsight | AIInsightWithUserAnalysis:
-        prompt = self._build_prompt(categories, few_shots, article_content, custom_system_prompt)
-        messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=prompt),
-        ]
+        messages, output_schema, cache_key = self._prepare_analysis(
+            categories, few_shots, article_content, custom_system_prompt
+        )
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        structured_llm = structured_output(self.llm, output_schema)
+        insight = structured_llm.invoke(messages)
+        return self._finalize_insight(insight, categories, cache_key)
 
+    async def aanalyze(
+        self,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+        article_content: str,
+        custom_system_prompt: str | None = None,
+    ) -> AIInsight | AIInsightWithUserAnalysis:
+        messages, output_schema, cache_key = self._prepare_analysis(
+            categories, few_shots, article_content, custom_system_prompt
+        )
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        structured_llm = structured_output(self.llm, output_schema)
+        insight = await structured_llm.ainvoke(messages)
+        return self._finalize_insight(insight, categories, cache_key)
+
+    async def analyze_many(
+        self,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+        articles: list[str],
+        custom_system_prompt: str | None = None,
+    ) -> list[AIInsight | AIInsightWithUserAnalysis]:
+        """Analyze articles concurrently, at most `max_concurrency` calls in flight."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def analyze_one(article_content: str) -> AIInsight | AIInsightWithUserAnalysis:
+            async with semaphore:
+                return await self.aanalyze(
+                    categories, few_shots, article_content, custom_system_prompt
+                )
+
+        return list(await asyncio.gather(*(analyze_one(a) for a in articles)))
+
+    def analyze_batch(
+        self,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+        articles: list[str],
+        custom_system_prompt: str | None = None,
+    ) -> list[AIInsight | AIInsightWithUserAnalysis]:
+        """Classify articles in groups of `batch_size`, one LLM call per group."""
         if custom_system_prompt:
-            structured_llm = self.llm.with_structured_output(AIInsightWithUserAnalysis)
+            output_schema = AIInsightWithUserAnalysisBatch
         else:
-            structured_llm = self.llm.with_structured_output(AIInsight)
+            output_schema = AIInsightBatch
+        structured_llm = structured_output(self.llm, output_schema)
 
-        insight = structured_llm.invoke(messages)
+        insights: list[AIInsight | AIInsightWithUserAnalysis] = []
+        for start in range(0, len(articles), self.batch_size):
+            batch = articles[start:start + self.batch_size]
+            prompt = self._build_batch_prompt(categories, few_shots, batch, custom_system_prompt)
+            messages = [
+                SystemMessage(content=self.system_prompt),
+                HumanMessage(content=prompt),
+            ]
 
-        allowed_categories = {cat.name for cat in categories}
-        if insight.category not in allowed_categories:
-            coerced = self._coerce_category_from_excerpt(insight, categories)
-            if coerced:
-                insight.category = coerced
-            else:
+            results = structured_llm.invoke(messages).results
+            if len(results) != len(batch):
                 raise ValueError(
-                    f"LLM returned category '{insight.category}' not in allowed set"
+                    f"LLM returned {len(results)} results for a batch of {len(batch)} articles"
                 )
 
+            insights.extend(
+                self._ensure_allowed_category(insight, categories) for insight in results
+            )
+
+        return insights
+
+    def _prepare_analysis(
+        self,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+        article_content: str,
+        custom_system_prompt: str | None,
+    ) -> tuple[list[BaseMessage], type[AIInsight] | type[AIInsightWithUserAnalysis], str]:
+        prompt = self._build_prompt(categories, few_shots, article_content, custom_system_prompt)
+        output_schema = AIInsightWithUserAnalysis if custom_system_prompt else AIInsight
+
+        # The rendered prompt already covers article, categories, few-shots and
+        # custom instructions, so identical requests map to the same key.
+        cache_key = make_cache_key(self.system_prompt, prompt, output_schema.__name__)
+        messages: list[BaseMessage] = [
+            SystemMessage(content=self.system_prompt),
+            HumanMessage(content=prompt),
+        ]
+        return messages, output_schema, cache_key
+
+    def _get_cached(self, cache_key: str) -> AIInsight | AIInsightWithUserAnalysis | None:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(cache_key)
+        return cached.model_copy(deep=True) if cached is not None else None
+
+    def _finalize_insight(
+        self,
+        insight: AIInsight | AIInsightWithUserAnalysis,
+        categories: list[CategoryDefinition],
+        cache_key: str,
+    ) -> AIInsight | AIInsightWithUserAnalysis:
+        insight = self._ensure_allowed_category(insight, categories)
+        if self.cache is not None:
+            self.cache.set(cache_key, insight.model_copy(deep=True))
         return insight
 
+    def _ensure_allowed_category(
+        self,
+        insight: AIInsight | AIInsightWithUserAnalysis,
+        categories: list[CategoryDefinition],
+    ) -> AIInsight | AIInsightWithUserAnalysis:
+        if any(cat.name == insight.category for cat in categories):
+            return insight
+        coerced = self._coerce_category_from_excerpt(insight, categories)
+        if not coerced:
+            raise ValueError(
+                f"LLM returned category '{insight.category}' not in allowed set"
+            )
+        return insight.model_copy(update={"category": coerced})
+
     def _build_prompt(
         self,
         categories: list[CategoryDefinition],
@@ -49,41 +208,58 @@ class AnalysisAgent:
         article_content: str,
         custom_system_prompt: str | None = None,
     ) -> str:
-        parts = ["## Category Definitions\n"]
+        return self._assemble_prompt(
+            categories,
+            few_shots,
+            response_format="Respond with a JSON object containing:\n",
+            articles_section=f"\n## Article to Analyze\n{article_content}\n",
+            custom_system_prompt=custom_system_prompt,
+        )
+
+    def _build_batch_prompt(
+        self,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+        articles: list[str],
+        custom_system_prompt: str | None = None,
+    ) -> str:
+        buf = io.StringIO()
+        buf.write(f"\n## Articles to Analyze ({len(articles)})\n")
+        for number, article_content in enumerate(articles, start=1):
+            buf.write(f"### Article {number}\n{article_content}\n\n")
 
-        parts.append(
-            "CRITICAL: Category names may be arbitrary or misleading. "
-            "You MUST classify based ONLY on the definition text, NOT the category name. "
-            "Match the news content against each definition and select the category "
-            "whose DEFINITION best describes the content.\n\n"
+        return self._assemble_prompt(
+            categories,
+            few_shots,
+            response_format=(
+                "Respond with a JSON object containing `results`: an array with exactly "
+                "one entry per article, in the order the articles are given below. "
+                "Each entry contains:\n"
+            ),
+            articles_section=buf.getvalue(),
+            custom_system_prompt=custom_system_prompt,
         )
 
-        for cat in categories:
-            parts.append(f"### {cat.name}\n")
-            parts.append(f"**Definition (use this for classification):** {cat.definition}\n\n")
-
-        allowed = [cat.name for cat in categories]
-        parts.append("Allowed category names for output (must match exactly):\n")
-        for name in allowed:
-            parts.append(f"- {name}\n")
-
-        if few_shots:
-            parts.append("\n## Examples\n")
-            for ex in few_shots:
-                parts.append(f"**News:** {ex.news_content}\n")
-                parts.append(f"**Category:** {ex.category}\n")
-                parts.append(f"**Reasoning:** {ex.reasoning}\n\n")
-
-        parts.append("\n## Article to Analyze\n")
-        parts.append(article_content)
-        parts.append("\n\n## Instructions\n")
-        parts.append("Respond with a JSON object containing:\n")
-        parts.append("- category: the category name\n")
-        parts.append("- reasoning_table: array of {category_excerpt, news_excerpt, reasoning}\n")
-        parts.append("- confidence: float between 0 and 1\n")
+    def _assemble_prompt(
+        self,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+        response_format: str,
+        articles_section: str,
+        custom_system_prompt: str | None = None,
+    ) -> str:
+        # Everything before the article is identical across articles for a given
+        # workspace config, so providers can serve it from their prompt cache.
+        buf = io.StringIO()
+        buf.write(_render_prefix(categories, few_shots))
+        buf.write("\n## Instructions\n")
+        buf.write(response_format)
+        buf.write("- category: the category name\n")
+        buf.write("- reasoning_table: array of {category_excerpt, news_excerpt, reasoning}\n")
+        buf.write("- confidence: float between 0 and 1\n")
         if custom_system_prompt:
-            parts.append("- user_requested_analysis: your response to the Additional Instructions below\n")
-        parts.append(
+            buf.write("- user_requested_analysis: your response to the Additional Instructions below\n")
+        buf.write(
             "\nRules:\n"
             "- IGNORE category names when deciding classification - use ONLY the definition text\n"
             "- category MUST be one of the Allowed category names listed above (exact match)\n"
@@ -93,11 +269,12 @@ class AnalysisAgent:
         )
 
         if custom_system_prompt:
-            parts.append("\n## Additional Instructions\n")
-            parts.append(custom_system_prompt)
-            parts.append("\n\nRespond to these instructions in the `user_requested_analysis` field.\n")
+            buf.write("\n## Additional Instructions\n")
+            buf.write(custom_system_prompt)
+            buf.write("\n\nRespond to these instructions in the `user_requested_analysis` field.\n")
 
-        return "".join(parts)
+        buf.write(articles_section)
+        return buf.getvalue()
 
     def _coerce_category_from_excerpt(
         self,
@@ -107,22 +284,29 @@ class AnalysisAgent:
         if not insight.reasoning_table:
             return None
 
+        # Strip and de-duplicate once; definitions are then scanned per category.
+        excerpts = {
+            excerpt: None
+            for excerpt in (row.category_excerpt.strip() for row in insight.reasoning_table)
+            if excerpt
+        }
+        if not excerpts:
+            return None
+
+        # Longest first, so the first excerpt found in a definition is its score.
+        excerpts_by_length = sorted(excerpts, key=len, reverse=True)
+
         best_category: str | None = None
         best_score = 0
         tie = False
 
         for cat in categories:
-            definition = cat.definition or ""
-            if not definition:
+            if not cat.definition:
                 continue
 
-            score_for_cat = 0
-            for row in insight.reasoning_table:
-                excerpt = (row.category_excerpt or "").strip()
-                if not excerpt:
-                    continue
-                if excerpt in definition:
-                    score_for_cat = max(score_for_cat, len(excerpt))
+            score_for_cat = next(
+                (len(e) for e in excerpts_by_length if e in cat.definition), 0
+            )
 
             if score_for_cat > best_score:
                 best_score = score_for_cat
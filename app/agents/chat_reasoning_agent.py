@@ -1,4 +1,6 @@
-from typing import Iterator
+import io
+import time
+from typing import AsyncIterator, Iterator
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
@@ -7,6 +9,59 @@ from app.models.chat import ChatMessage
 from app.models.feedback import AIInsight
 from app.models.prompts import CategoryDefinition, FewShotExample
 
+_FLUSH_MAX_CHUNKS = 16
+_FLUSH_INTERVAL_SECONDS = 0.05
+
+_CHAT_HEADER = """You are an AI assistant explaining your classification reasoning.
+You previously analyzed a news article and classified it into a category.
+Now the user wants to understand your thought process.
+
+YOUR ROLE:
+- Explain WHY you made the classification decision
+- Compare against other categories when asked
+- Reference specific excerpts from the article
+- Explain how few-shot examples influenced your thinking
+- Be honest about uncertainty or close calls
+
+DO NOT:
+- Re-classify the article
+- Change your original decision
+- Make up information not in the provided context
+
+## Category Definitions Available
+"""
+
+
+class _ChunkCoalescer:
+    """Batch provider chunks so SSE framing runs per batch, not per token.
+
+    The first chunk is released straight away.
+    """
+
+    def __init__(self) -> None:
+        self._buffer: list[str] = []
+        self._last_flush = float("-inf")
+
+    def add(self, content: object) -> str | None:
+        if not content or not isinstance(content, str):
+            return None
+        self._buffer.append(content)
+        now = time.monotonic()
+        if (
+            len(self._buffer) >= _FLUSH_MAX_CHUNKS
+            or now - self._last_flush >= _FLUSH_INTERVAL_SECONDS
+        ):
+            self._last_flush = now
+            return self.flush()
+        return None
+
+    def flush(self) -> str | None:
+        if not self._buffer:
+            return None
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        return text
+
 
 class ChatReasoningAgent:
     def __init__(self, llm: BaseChatModel):
@@ -21,6 +76,52 @@ class ChatReasoningAgent:
         chat_history: list[ChatMessage],
         message: str,
     ) -> Iterator[str]:
+        messages = self._prepare_messages(
+            article_content, categories, few_shots, ai_insight, chat_history, message
+        )
+
+        coalescer = _ChunkCoalescer()
+        for chunk in self.llm.stream(messages):
+            text = coalescer.add(chunk.content)
+            if text:
+                yield text
+
+        text = coalescer.flush()
+        if text:
+            yield text
+
+    async def astream(
+        self,
+        article_content: str,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+        ai_insight: AIInsight,
+        chat_history: list[ChatMessage],
+        message: str,
+    ) -> AsyncIterator[str]:
+        messages = self._prepare_messages(
+            article_content, categories, few_shots, ai_insight, chat_history, message
+        )
+
+        coalescer = _ChunkCoalescer()
+        async for chunk in self.llm.astream(messages):
+            text = coalescer.add(chunk.content)
+            if text:
+                yield text
+
+        text = coalescer.flush()
+        if text:
+            yield text
+
+    def _prepare_messages(
+        self,
+        article_content: str,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+        ai_insight: AIInsight,
+        chat_history: list[ChatMessage],
+        message: str,
+    ) -> list[BaseMessage]:
         system_message = self._build_system_message(
             article_content=article_content,
             categories=categories,
@@ -28,16 +129,12 @@ class ChatReasoningAgent:
             ai_insight=ai_insight,
         )
 
-        messages = self._build_messages(
+        return self._build_messages(
             system_message=system_message,
             chat_history=chat_history,
             current_message=message,
         )
 
-        for chunk in self.llm.stream(messages):
-            if chunk.content and isinstance(chunk.content, str):
-                yield chunk.content
-
     def _build_system_message(
         self,
         article_content: str,
@@ -45,53 +142,33 @@ class ChatReasoningAgent:
         few_shots: list[FewShotExample],
         ai_insight: AIInsight,
     ) -> str:
-        parts = [
-            "You are an AI assistant explaining your classification reasoning.",
-            "You previously analyzed a news article and classified it into a category.",
-            "Now the user wants to understand your thought process.",
-            "",
-            "YOUR ROLE:",
-            "- Explain WHY you made the classification decision",
-            "- Compare against other categories when asked",
-            "- Reference specific excerpts from the article",
-            "- Explain how few-shot examples influenced your thinking",
-            "- Be honest about uncertainty or close calls",
-            "",
-            "DO NOT:",
-            "- Re-classify the article",
-            "- Change your original decision",
-            "- Make up information not in the provided context",
-            "",
-            "## Original Article",
-            article_content,
-            "",
-            "## Category Definitions Available",
-        ]
+        buf = io.StringIO()
+        buf.write(_CHAT_HEADER)
 
         for cat in categories:
-            parts.append(f"### {cat.name}")
-            parts.append(f"{cat.definition}")
-            parts.append("")
+            buf.write(f"### {cat.name}\n{cat.definition}\n\n")
 
         if few_shots:
-            parts.append("## Few-Shot Examples Used")
+            buf.write("## Few-Shot Examples Used\n")
             for ex in few_shots:
-                parts.append(f"- News: {ex.news_content}")
-                parts.append(f"  Category: {ex.category}")
-                parts.append(f"  Reasoning: {ex.reasoning}")
-                parts.append("")
-
-        parts.append("## Your Classification Result")
-        parts.append(f"Category: {ai_insight.category}")
-        parts.append(f"Confidence: {ai_insight.confidence:.0%}")
-        parts.append("")
-        parts.append("Reasoning Table:")
+                buf.write(f"- News: {ex.news_content}\n")
+                buf.write(f"  Category: {ex.category}\n")
+                buf.write(f"  Reasoning: {ex.reasoning}\n\n")
+
+        # The article varies per conversation, so it follows the blocks that are
+        # shared by every conversation in the workspace.
+        buf.write(f"## Original Article\n{article_content}\n\n")
+
+        buf.write("## Your Classification Result\n")
+        buf.write(f"Category: {ai_insight.category}\n")
+        buf.write(f"Confidence: {ai_insight.confidence:.0%}\n\n")
+        buf.write("Reasoning Table:")
         for row in ai_insight.reasoning_table:
-            parts.append(f"- Category Excerpt: {row.category_excerpt}")
-            parts.append(f"  News Excerpt: {row.news_excerpt}")
-            parts.append(f"  Reasoning: {row.reasoning}")
+            buf.write(f"\n- Category Excerpt: {row.category_excerpt}")
+            buf.write(f"\n  News Excerpt: {row.news_excerpt}")
+            buf.write(f"\n  Reasoning: {row.reasoning}")
 
-        return "\n".join(parts)
+        return buf.getvalue()
 
     def _build_messages(
         self,
@@ -1,9 +1,11 @@
-import json
-import uuid
+import io
+import secrets
 
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from pydantic import BaseModel, Field
 
+from app.agents.llm_provider import structured_output
 from app.models.feedback import (
     EvaluationReport,
     Feedback,
@@ -28,9 +30,19 @@ Respond with a JSON object containing:
 """
 
 
+class EvaluationPayload(BaseModel):
+    """What the LLM returns; ids are assigned when building the report."""
+
+    diagnosis: str
+    prompt_gaps: list[PromptGap] = Field(default_factory=list)
+    few_shot_gaps: list[FewShotGap] = Field(default_factory=list)
+    summary: str
+
+
 class EvaluationAgent:
     def __init__(self, llm: BaseChatModel):
         self.llm = llm
+        self._structured_llm = structured_output(llm, EvaluationPayload)
 
     def evaluate(
         self,
@@ -38,13 +50,31 @@ class EvaluationAgent:
         categories: list[CategoryDefinition],
         few_shots: list[FewShotExample],
     ) -> EvaluationReport:
+        messages = self._build_messages(feedback, categories, few_shots)
+        payload = self._structured_llm.invoke(messages)
+        return self._build_report(feedback.id, payload)
+
+    async def aevaluate(
+        self,
+        feedback: Feedback,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+    ) -> EvaluationReport:
+        messages = self._build_messages(feedback, categories, few_shots)
+        payload = await self._structured_llm.ainvoke(messages)
+        return self._build_report(feedback.id, payload)
+
+    def _build_messages(
+        self,
+        feedback: Feedback,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+    ) -> list[BaseMessage]:
         prompt = self._build_prompt(feedback, categories, few_shots)
-        messages = [
+        return [
             SystemMessage(content=EVALUATION_SYSTEM_PROMPT),
             HumanMessage(content=prompt),
         ]
-        response = self.llm.invoke(messages)
-        return self._parse_response(feedback.id, response.content)
 
     def _build_prompt(
         self,
@@ -52,39 +82,35 @@ class EvaluationAgent:
         categories: list[CategoryDefinition],
         few_shots: list[FewShotExample],
     ) -> str:
-        parts = ["## Feedback Details\n"]
-        parts.append(f"- Thumbs up: {feedback.thumbs_up}\n")
-        parts.append(f"- AI predicted: {feedback.ai_insight.category}\n")
-        parts.append(f"- Correct category: {feedback.correct_category}\n")
-        parts.append(f"- User reasoning: {feedback.reasoning}\n\n")
+        buf = io.StringIO()
+        buf.write("## Feedback Details\n")
+        buf.write(f"- Thumbs up: {feedback.thumbs_up}\n")
+        buf.write(f"- AI predicted: {feedback.ai_insight.category}\n")
+        buf.write(f"- Correct category: {feedback.correct_category}\n")
+        buf.write(f"- User reasoning: {feedback.reasoning}\n\n")
 
-        parts.append("## Current Category Definitions\n")
+        buf.write("## Current Category Definitions\n")
         for cat in categories:
-            parts.append(f"### {cat.name}\n{cat.definition}\n\n")
+            buf.write(f"### {cat.name}\n{cat.definition}\n\n")
 
         if few_shots:
-            parts.append("## Current Few-Shot Examples\n")
-            for ex in few_shots:
-                parts.append(f"- ID: {ex.id}, Category: {ex.category}\n")
-                parts.append(f"  Content: {ex.news_content[:100]}...\n\n")
-
-        return "".join(parts)
-
-    def _parse_response(self, feedback_id: str, response: str) -> EvaluationReport:
-        cleaned = response.strip()
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        if cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
-
-        data = json.loads(cleaned.strip())
+            buf.write("## Current Few-Shot Examples\n")
+            buf.write(
+                "".join(
+                    f"- ID: {ex.id}, Category: {ex.category}\n"
+                    f"  Content: {ex.news_content[:100]}...\n\n"
+                    for ex in few_shots
+                )
+            )
+
+        return buf.getvalue()
+
+    def _build_report(self, feedback_id: str, payload: EvaluationPayload) -> EvaluationReport:
         return EvaluationReport(
-            id=f"rpt-{uuid.uuid4().hex[:8]}",
+            id=f"rpt-{secrets.token_hex(4)}",
             feedback_id=feedback_id,
-            diagnosis=data["diagnosis"],
-            prompt_gaps=[PromptGap(**gap) for gap in data.get("prompt_gaps", [])],
-            few_shot_gaps=[FewShotGap(**gap) for gap in data.get("few_shot_gaps", [])],
-            summary=data["summary"],
+            diagnosis=payload.diagnosis,
+            prompt_gaps=payload.prompt_gaps,
+            few_shot_gaps=payload.few_shot_gaps,
+            summary=payload.summary,
         )
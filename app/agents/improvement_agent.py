@@ -1,8 +1,12 @@
-import json
+import io
+import re
 
+import orjson
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from pydantic import TypeAdapter
 
+from app.agents.response_cache import ResponseCache, make_cache_key
 from app.models.feedback import (
     FeedbackWithHeadline,
     ImprovementSuggestion,
@@ -61,9 +65,47 @@ Rules:
 """
 
 
+IMPROVEMENT_BATCH_INSTRUCTIONS = """
+BATCHED REQUEST:
+The input contains several independent groups, each under a "# Group N" heading with its own feedback, category definitions and few-shot examples. Treat every group in isolation and never reference feedback IDs from another group.
+
+Respond with a JSON object {"results": [...]} holding exactly one entry per group. Each entry is {"group_id": N, ...} followed by the fields described above for that group.
+"""
+
+IMPROVEMENT_BATCH_SYSTEM_PROMPT = IMPROVEMENT_SYSTEM_PROMPT + IMPROVEMENT_BATCH_INSTRUCTIONS
+
+_FENCE_RE = re.compile(r"\A\s*```(?:json)?|```\s*\Z")
+
+_UPDATED_CATEGORIES_ADAPTER = TypeAdapter(list[UpdatedCategory])
+
+_MAX_ARTICLE_CHARS = 8000
+
+
+def _truncate(text: str, max_chars: int = _MAX_ARTICLE_CHARS) -> str:
+    """Keep the head and tail of long text, where ledes and conclusions sit."""
+    if len(text) <= max_chars:
+        return text
+    half = max_chars // 2
+    return f"{text[:half]}\n…[truncated]…\n{text[-half:]}"
+
+
+FeedbackGroup = tuple[
+    list[FeedbackWithHeadline], list[CategoryDefinition], list[FewShotExample]
+]
+
+
 class ImprovementAgent:
-    def __init__(self, llm: BaseChatModel):
+    __slots__ = ("llm", "cache", "batch_size")
+
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        cache: ResponseCache[ImprovementSuggestion] | None = None,
+        batch_size: int = 4,
+    ):
         self.llm = llm
+        self.cache = cache
+        self.batch_size = batch_size
 
     def suggest_improvements(
         self,
@@ -71,18 +113,87 @@ class ImprovementAgent:
         categories: list[CategoryDefinition],
         few_shots: list[FewShotExample],
     ) -> ImprovementSuggestion:
+        messages = self._build_messages(feedbacks, categories, few_shots)
+        cache_key = self._cache_key(messages)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        # Stream so the connection stays active during long generations.
+        buf = io.StringIO()
+        for chunk in self.llm.stream(messages):
+            buf.write(self._response_text(chunk))
+        suggestion = self._parse_response(buf.getvalue(), feedbacks)
+        return self._store(cache_key, suggestion)
+
+    async def asuggest_improvements(
+        self,
+        feedbacks: list[FeedbackWithHeadline],
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+    ) -> ImprovementSuggestion:
+        messages = self._build_messages(feedbacks, categories, few_shots)
+        cache_key = self._cache_key(messages)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        buf = io.StringIO()
+        async for chunk in self.llm.astream(messages):
+            buf.write(self._response_text(chunk))
+        suggestion = self._parse_response(buf.getvalue(), feedbacks)
+        return self._store(cache_key, suggestion)
+
+    def suggest_improvements_batched(
+        self, groups: list[FeedbackGroup]
+    ) -> list[ImprovementSuggestion]:
+        """Suggest improvements for independent feedback groups, `batch_size` groups per LLM call."""
+        suggestions: list[ImprovementSuggestion] = []
+        for start in range(0, len(groups), self.batch_size):
+            batch = groups[start:start + self.batch_size]
+            messages = [
+                SystemMessage(content=IMPROVEMENT_BATCH_SYSTEM_PROMPT),
+                HumanMessage(content=self._build_batch_prompt(batch)),
+            ]
+            response = self.llm.invoke(messages)
+            suggestions.extend(self._parse_batch_response(self._response_text(response), batch))
+        return suggestions
+
+    def _build_messages(
+        self,
+        feedbacks: list[FeedbackWithHeadline],
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+    ) -> list[BaseMessage]:
         prompt = self._build_prompt(feedbacks, categories, few_shots)
-        messages = [
+        return [
             SystemMessage(content=IMPROVEMENT_SYSTEM_PROMPT),
             HumanMessage(content=prompt),
         ]
-        response = self.llm.invoke(messages)
+
+    def _cache_key(self, messages: list[BaseMessage]) -> str:
+        # The rendered prompt covers every feedback field, definition and
+        # few-shot, so only an identical bundle maps to the same key.
+        return make_cache_key(*(str(message.content) for message in messages))
+
+    def _get_cached(self, cache_key: str) -> ImprovementSuggestion | None:
+        if self.cache is None:
+            return None
+        cached = self.cache.get(cache_key)
+        return cached.model_copy(deep=True) if cached is not None else None
+
+    def _store(self, cache_key: str, suggestion: ImprovementSuggestion) -> ImprovementSuggestion:
+        if self.cache is not None:
+            self.cache.set(cache_key, suggestion.model_copy(deep=True))
+        return suggestion
+
+    def _response_text(self, response: BaseMessage) -> str:
         response_content = response.content
         if not isinstance(response_content, str):
             raise TypeError(
                 f"Expected string response from LLM, got {type(response_content)}"
             )
-        return self._parse_response(response_content, feedbacks)
+        return response_content
 
     def _build_prompt(
         self,
@@ -90,67 +201,116 @@ class ImprovementAgent:
         categories: list[CategoryDefinition],
         few_shots: list[FewShotExample],
     ) -> str:
-        parts = ["## User Feedback (AUTHORITATIVE)\n\n"]
-
-        for fb in feedbacks:
-            parts.append(f"### Feedback {fb.id}\n")
-            parts.append(f"**Article Headline:** {fb.article_headline}\n")
-            parts.append(f"**Article Content:**\n{fb.article_content}\n\n")
-            verdict = "Correct" if fb.thumbs_up else "Incorrect"
-            parts.append(f"**User Verdict:** {verdict}\n")
-            if not fb.thumbs_up:
-                parts.append(f"**User's Correct Category:** {fb.correct_category}\n")
-            parts.append(f"**User's Reasoning (AUTHORITATIVE):** {fb.reasoning}\n")
-            confidence_pct = f"{fb.ai_insight.confidence:.0%}"
-            parts.append(f"**AI Predicted:** {fb.ai_insight.category} ({confidence_pct} confidence)\n")
-            if fb.ai_insight.reasoning_table:
-                parts.append("**AI Reasoning Table:**\n")
-                for row in fb.ai_insight.reasoning_table:
-                    parts.append(f"  - {row.category_excerpt} | {row.news_excerpt} | {row.reasoning}\n")
-            parts.append("\n")
+        # Categories and few-shots change far less often than feedback, so they
+        # lead the prompt where providers can reuse the cached prefix.
+        context = self._build_context_prompt(categories, few_shots)
+        return context + self._build_feedback_prompt(feedbacks)
 
-        parts.append("## Current Category Definitions\n")
+    def _build_context_prompt(
+        self,
+        categories: list[CategoryDefinition],
+        few_shots: list[FewShotExample],
+    ) -> str:
+        buf = io.StringIO()
+        buf.write("## Current Category Definitions\n")
         for cat in categories:
-            parts.append(f"### {cat.name}\n{cat.definition}\n\n")
+            buf.write(f"### {cat.name}\n{cat.definition}\n\n")
 
         if few_shots:
-            parts.append("## Current Few-Shot Examples\n")
+            buf.write("## Current Few-Shot Examples\n")
             for ex in few_shots:
-                parts.append(f"### {ex.id}\n")
-                parts.append(f"- Category: {ex.category}\n")
-                parts.append(f"- Content: {ex.news_content}\n")
-                parts.append(f"- Reasoning: {ex.reasoning}\n\n")
+                buf.write(f"### {ex.id}\n")
+                buf.write(f"- Category: {ex.category}\n")
+                buf.write(f"- Content: {ex.news_content}\n")
+                buf.write(f"- Reasoning: {ex.reasoning}\n\n")
 
-        return "".join(parts)
+        return buf.getvalue()
+
+    def _build_feedback_prompt(self, feedbacks: list[FeedbackWithHeadline]) -> str:
+        buf = io.StringIO()
+        buf.write("## User Feedback (AUTHORITATIVE)\n\n")
+
+        for fb in feedbacks:
+            buf.write(f"### Feedback {fb.id}\n")
+            buf.write(f"**Article Headline:** {fb.article_headline}\n")
+            buf.write(f"**Article Content:**\n{_truncate(fb.article_content)}\n\n")
+            verdict = "Correct" if fb.thumbs_up else "Incorrect"
+            buf.write(f"**User Verdict:** {verdict}\n")
+            if not fb.thumbs_up:
+                buf.write(f"**User's Correct Category:** {fb.correct_category}\n")
+            buf.write(f"**User's Reasoning (AUTHORITATIVE):** {fb.reasoning}\n")
+            confidence_pct = f"{fb.ai_insight.confidence:.0%}"
+            buf.write(f"**AI Predicted:** {fb.ai_insight.category} ({confidence_pct} confidence)\n")
+            if fb.ai_insight.reasoning_table:
+                buf.write("**AI Reasoning Table:**\n")
+                buf.write(
+                    "".join(
+                        f"  - {row.category_excerpt} | {row.news_excerpt} | {row.reasoning}\n"
+                        for row in fb.ai_insight.reasoning_table
+                    )
+                )
+            buf.write("\n")
+
+        return buf.getvalue()
+
+    def _build_batch_prompt(self, groups: list[FeedbackGroup]) -> str:
+        return "".join(
+            f"# Group {group_id}\n\n{self._build_prompt(feedbacks, categories, few_shots)}\n"
+            for group_id, (feedbacks, categories, few_shots) in enumerate(groups, start=1)
+        )
 
     def _derive_updated_categories(
         self, category_suggestions: list[dict]
     ) -> list[UpdatedCategory]:
         """Derive updated_categories from category_suggestions for guaranteed traceability."""
-        return [
-            UpdatedCategory(
-                category=s["category"],
-                updated_definition=s["suggested"],
-                based_on_feedback_ids=s.get("based_on_feedback_ids", []),
-                rationale=s.get("rationale", ""),
-            )
-            for s in category_suggestions
-            if s.get("category") and s.get("suggested")
-        ]
+        return _UPDATED_CATEGORIES_ADAPTER.validate_python(
+            [
+                {
+                    "category": s["category"],
+                    "updated_definition": s["suggested"],
+                    "based_on_feedback_ids": s.get("based_on_feedback_ids", []),
+                    "rationale": s.get("rationale", ""),
+                }
+                for s in category_suggestions
+                if s.get("category") and s.get("suggested")
+            ]
+        )
 
     def _parse_response(
         self, response: str, feedbacks: list[FeedbackWithHeadline]
     ) -> ImprovementSuggestion:
-        cleaned = response.strip()
-        if cleaned.startswith("```json"):
-            cleaned = cleaned[7:]
-        if cleaned.startswith("```"):
-            cleaned = cleaned[3:]
-        if cleaned.endswith("```"):
-            cleaned = cleaned[:-3]
+        return self._build_suggestion(self._load_json(response), feedbacks)
+
+    def _parse_batch_response(
+        self, response: str, groups: list[FeedbackGroup]
+    ) -> list[ImprovementSuggestion]:
+        results_by_group: dict[int, dict] = {}
+        for item in self._load_json(response).get("results", []):
+            # Models sometimes echo ids as "1" or 1.0; skip items without a usable id.
+            try:
+                group_id = int(item["group_id"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            results_by_group.setdefault(group_id, item)
+        missing = [
+            group_id
+            for group_id in range(1, len(groups) + 1)
+            if group_id not in results_by_group
+        ]
+        if missing:
+            raise ValueError(f"LLM returned no results for groups {missing}")
 
-        data = json.loads(cleaned.strip())
+        return [
+            self._build_suggestion(results_by_group[group_id], feedbacks)
+            for group_id, (feedbacks, _, _) in enumerate(groups, start=1)
+        ]
+
+    def _load_json(self, response: str) -> dict:
+        return orjson.loads(_FENCE_RE.sub("", response).strip())
 
+    def _build_suggestion(
+        self, data: dict, feedbacks: list[FeedbackWithHeadline]
+    ) -> ImprovementSuggestion:
         category_suggestions = data.get("category_suggestions", [])
         updated_categories = self._derive_updated_categories(category_suggestions)
 
@@ -171,23 +331,29 @@ class ImprovementAgent:
         self, updated_few_shots: list[dict], feedbacks: list[FeedbackWithHeadline]
     ) -> list[dict]:
         """Populate news_content for user_article sources from feedback article content."""
-        feedback_by_id = {fb.id: fb for fb in feedbacks}
+        needed_ids = {
+            item["based_on_feedback_id"]
+            for item in updated_few_shots
+            if item.get("source") == "user_article" and item.get("based_on_feedback_id")
+        }
+        if not needed_ids:
+            return updated_few_shots
+
+        content_by_feedback_id = {
+            fb.id: fb.article_content for fb in feedbacks if fb.id in needed_ids
+        }
 
         for item in updated_few_shots:
-            source = item.get("source")
-            if source != "user_article":
+            if item.get("source") != "user_article":
                 continue
 
-            feedback_id = item.get("based_on_feedback_id")
-            if not feedback_id:
+            # Only examples still missing content need the feedback lookup.
+            example = item.get("example")
+            if example is None or example.get("news_content") is not None:
                 continue
 
-            feedback = feedback_by_id.get(feedback_id)
-            if not feedback:
-                continue
-
-            example = item.get("example", {})
-            if example.get("news_content") is None:
-                example["news_content"] = feedback.article_content
+            feedback_id = item.get("based_on_feedback_id")
+            if feedback_id and feedback_id in content_by_feedback_id:
+                example["news_content"] = content_by_feedback_id[feedback_id]
 
         return updated_few_shots
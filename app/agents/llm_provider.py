@@ -1,5 +1,12 @@
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.runnables import Runnable
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
+from pydantic import BaseModel
 
 from app.config import Settings
 
@@ -12,32 +19,86 @@ class LLMConfigurationError(Exception):
 
 def get_llm(settings: Settings):
     """Factory function to create LLM based on configuration."""
-    if settings.llm_provider == "openrouter":
-        if not settings.openrouter_api_key:
+    return _build_llm(
+        settings.llm_provider,
+        settings.openrouter_api_key,
+        settings.openrouter_model,
+        settings.azure_openai_api_key,
+        settings.azure_openai_endpoint,
+        settings.azure_openai_deployment,
+        settings.google_api_key,
+        settings.gemini_model,
+    )
+
+
+# Clients are reused for identical configuration so every agent shares one
+# HTTP connection pool instead of opening its own.
+@lru_cache(maxsize=4)
+def _build_llm(
+    provider: str,
+    openrouter_api_key: str | None,
+    openrouter_model: str,
+    azure_openai_api_key: str | None,
+    azure_openai_endpoint: str | None,
+    azure_openai_deployment: str | None,
+    google_api_key: str | None,
+    gemini_model: str,
+):
+    if provider == "openrouter":
+        if not openrouter_api_key:
             raise LLMConfigurationError("OPENROUTER_API_KEY is required")
         return ChatOpenAI(
-            model=settings.openrouter_model,
-            openai_api_key=settings.openrouter_api_key,
+            model=openrouter_model,
+            openai_api_key=openrouter_api_key,
             openai_api_base="https://openrouter.ai/api/v1",
         )
-    elif settings.llm_provider == "azure":
-        if not settings.azure_openai_api_key:
+    elif provider == "azure":
+        if not azure_openai_api_key:
             raise LLMConfigurationError("AZURE_OPENAI_API_KEY is required")
-        if not settings.azure_openai_endpoint:
+        if not azure_openai_endpoint:
             raise LLMConfigurationError("AZURE_OPENAI_ENDPOINT is required")
-        if not settings.azure_openai_deployment:
+        if not azure_openai_deployment:
             raise LLMConfigurationError("AZURE_OPENAI_DEPLOYMENT is required")
         return ChatOpenAI(
-            model=settings.azure_openai_deployment,
-            openai_api_key=settings.azure_openai_api_key,
-            openai_api_base=settings.azure_openai_endpoint,
+            model=azure_openai_deployment,
+            openai_api_key=azure_openai_api_key,
+            openai_api_base=azure_openai_endpoint,
         )
-    elif settings.llm_provider == "gemini":
-        if not settings.google_api_key:
+    elif provider == "gemini":
+        if not google_api_key:
             raise LLMConfigurationError("GOOGLE_API_KEY is required")
         return ChatGoogleGenerativeAI(
-            model=settings.gemini_model,
-            google_api_key=settings.google_api_key,
+            model=gemini_model,
+            google_api_key=google_api_key,
         )
     else:
-        raise LLMConfigurationError(f"Unknown LLM provider: {settings.llm_provider}")
+        raise LLMConfigurationError(f"Unknown LLM provider: {provider}")
+
+
+# Binding a schema converts it to a tool/JSON schema. Agents are built per
+# request, so bindings are kept here, per client and schema. Chat models
+# aren't hashable, hence the id() key; each entry holds its client so that
+# id can't be reused while the entry lives.
+_MAX_STRUCTURED_LLMS = 32
+_structured_llms: OrderedDict[
+    tuple[int, type[BaseModel]], tuple[BaseChatModel, Runnable]
+] = OrderedDict()
+_structured_llms_lock = threading.Lock()
+
+
+def structured_output(llm: BaseChatModel, schema: type[BaseModel]) -> Runnable:
+    """`llm.with_structured_output(schema)`, bound once per client and schema."""
+    key = (id(llm), schema)
+    with _structured_llms_lock:
+        entry = _structured_llms.get(key)
+        if entry is not None:
+            _structured_llms.move_to_end(key)
+            return entry[1]
+
+    structured_llm = llm.with_structured_output(schema)
+    with _structured_llms_lock:
+        _structured_llms[key] = (llm, structured_llm)
+        _structured_llms.move_to_end(key)
+        while len(_structured_llms) > _MAX_STRUCTURED_LLMS:
+            _structured_llms.popitem(last=False)
+    return structured_llm
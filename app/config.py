@@ -1,6 +1,7 @@
+from functools import cached_property
+from pathlib import Path
 from typing import Literal
 
-from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,13 +25,11 @@ class Settings(BaseSettings):
     gemini_model: str = "gemini-1.5-pro"
 
     # Data paths
-    news_csv_path: str
-    workspaces_path: str
-    system_prompt_path: str
-
-    @field_validator("llm_provider", mode="before")
-    @classmethod
-    def validate_llm_provider(cls, v: str) -> str:
-        if v not in ("openrouter", "azure", "gemini"):
-            raise ValueError(f"Invalid LLM provider: {v}")
-        return v
+    news_csv_path: Path
+    workspaces_path: Path
+    system_prompt_path: Path
+
+    @cached_property
+    def system_prompt_text(self) -> str:
+        """The base system prompt, read once per Settings instance."""
+        return self.system_prompt_path.read_text()
@@ -1,11 +1,15 @@
 from functools import lru_cache
 from pathlib import Path
 
+from fastapi import Depends, HTTPException
+
+from app.agents.response_cache import ResponseCache
 from app.config import Settings
-from app.services.workspace_service import WorkspaceService
+from app.services.feedback_service import FeedbackService
 from app.services.news_service import NewsService
+from app.services.prompt_service import PromptService
+from app.services.workspace_service import WorkspaceNotFoundError, WorkspaceService
 from app.services.workspace_news_service import WorkspaceNewsService
-from app.agents.llm_provider import get_llm
 
 
 @lru_cache
@@ -14,24 +18,76 @@ def get_settings() -> Settings:
 
 
 def get_workspace_service() -> WorkspaceService:
-    settings = get_settings()
-    return WorkspaceService(Path(settings.workspaces_path))
+    return _workspace_service(get_settings().workspaces_path)
+
+
+def get_workspace_dir(
+    workspace_id: str,
+    workspace_service: WorkspaceService = Depends(get_workspace_service),
+) -> Path:
+    """Resolve the `workspace_id` path parameter, or respond 404."""
+    try:
+        return workspace_service.get_workspace_dir(workspace_id)
+    except WorkspaceNotFoundError:
+        raise HTTPException(status_code=404, detail="Workspace not found")
+
+
+def get_prompt_service(workspace_dir: Path = Depends(get_workspace_dir)) -> PromptService:
+    return _prompt_service(workspace_dir)
+
+
+def get_feedback_service(workspace_dir: Path = Depends(get_workspace_dir)) -> FeedbackService:
+    return FeedbackService(workspace_dir)
 
 
 def get_news_service() -> NewsService:
-    settings = get_settings()
-    return NewsService(Path(settings.news_csv_path))
+    return _news_service(get_settings().news_csv_path)
 
 
 def get_workspace_news_service() -> WorkspaceNewsService:
     settings = get_settings()
-    return WorkspaceNewsService(
-        Path(settings.workspaces_path),
-        Path(settings.news_csv_path)
-    )
+    return _workspace_news_service(settings.workspaces_path, settings.news_csv_path)
+
+
+# Services only hold their paths (plus NewsService's parsed CSV), so one
+# instance per path can be shared across requests. Keying on the path
+# rather than caching the getters keeps them correct when settings change.
+@lru_cache(maxsize=8)
+def _workspace_service(workspaces_path: Path) -> WorkspaceService:
+    return WorkspaceService(workspaces_path)
+
+
+@lru_cache(maxsize=8)
+def _news_service(news_csv_path: Path) -> NewsService:
+    return NewsService(news_csv_path)
+
+
+@lru_cache(maxsize=8)
+def _workspace_news_service(
+    workspaces_path: Path, news_csv_path: Path
+) -> WorkspaceNewsService:
+    return WorkspaceNewsService(workspaces_path, news_csv_path)
+
+
+# PromptService keeps parsed configs, so it is shared per workspace for that
+# cache to survive between requests; maxsize bounds how many are kept.
+# get_workspace_dir still checks the directory on every request, so a deleted
+# workspace's entry is never handed out. FeedbackService holds only paths and
+# is built per request.
+@lru_cache(maxsize=256)
+def _prompt_service(workspace_dir: Path) -> PromptService:
+    return PromptService(workspace_dir)
+
+
+@lru_cache
+def get_analysis_cache() -> ResponseCache:
+    return ResponseCache()
+
+
+@lru_cache
+def get_improvement_cache() -> ResponseCache:
+    return ResponseCache()
 
 
 def get_system_prompt() -> str:
-    settings = get_settings()
-    with open(settings.system_prompt_path) as f:
-        return f.read()
+    return get_settings().system_prompt_text
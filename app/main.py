@@ -11,15 +11,19 @@ app = FastAPI(title="Prompt Enhancer", version="0.1.0")
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Include routers
-app.include_router(pages.router)
-app.include_router(workspaces.router, prefix="/api")
-app.include_router(news.router, prefix="/api")
-app.include_router(prompts.router, prefix="/api")
-app.include_router(workflows.router, prefix="/api")
-app.include_router(workspace_news_router, prefix="/api")
-app.include_router(news_source_router, prefix="/api")
+ROUTERS = [
+    (pages.router, ""),
+    (workspaces.router, "/api"),
+    (news.router, "/api"),
+    (prompts.router, "/api"),
+    (workflows.router, "/api"),
+    (workspace_news_router, "/api"),
+    (news_source_router, "/api"),
+]
+for router, prefix in ROUTERS:
+    app.include_router(router, prefix=prefix)
 
 
-@app.get("/health")
+@app.get("/health", response_model=dict[str, str])
 def health_check():
     return {"status": "healthy"}
@@ -1,11 +1,13 @@
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.models.feedback import AIInsight
 
 
 class ChatMessage(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     role: Literal["user", "assistant"]
     content: str
 
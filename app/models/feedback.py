@@ -1,27 +1,42 @@
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class ReasoningRow(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     category_excerpt: str
     news_excerpt: str
     reasoning: str
 
 
 class AIInsight(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     category: str
     reasoning_table: list[ReasoningRow]
     confidence: float
 
 
 class AIInsightWithUserAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     category: str
     reasoning_table: list[ReasoningRow]
     confidence: float
     user_requested_analysis: str | None = None
 
 
+class AIInsightBatch(BaseModel):
+    results: list[AIInsight]
+
+
+class AIInsightWithUserAnalysisBatch(BaseModel):
+    results: list[AIInsightWithUserAnalysis]
+
+
 class Feedback(BaseModel):
     id: str
     article_id: str
@@ -53,6 +68,17 @@ class EvaluationReport(BaseModel):
     summary: str
 
 
+class FeedbackAccepted(BaseModel):
+    feedback_id: str
+    status: Literal["pending"] = "pending"
+
+
+class FeedbackEvaluationFailed(BaseModel):
+    feedback_id: str
+    status: Literal["failed"] = "failed"
+    error: str
+
+
 class UpdatedCategory(BaseModel):
     category: str
     updated_definition: str
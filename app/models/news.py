@@ -1,6 +1,6 @@
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class NewsSource(str, Enum):
@@ -9,6 +9,8 @@ class NewsSource(str, Enum):
 
 
 class NewsArticle(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: str
     headline: str
     content: str
@@ -1,27 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from app.dependencies import get_news_service
 from app.models.news import NewsArticle, NewsListResponse
+from app.routes.http_cache import conditional_json_response
 from app.services.news_service import ArticleNotFoundError, NewsService
 
 router = APIRouter(prefix="/news", tags=["news"])
 
+# The default news CSV is loaded once per process and never edited in place.
+_NEWS_CACHE_CONTROL = "private, max-age=60"
+
 
 @router.get("", response_model=NewsListResponse)
-def get_news(
+async def get_news(
+    request: Request,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     service: NewsService = Depends(get_news_service),
 ):
-    return service.get_news(page=page, limit=limit)
+    news = service.get_news(page=page, limit=limit)
+    return conditional_json_response(request, news, _NEWS_CACHE_CONTROL)
 
 
 @router.get("/{article_id}", response_model=NewsArticle)
-def get_article(
+async def get_article(
+    request: Request,
     article_id: str,
     service: NewsService = Depends(get_news_service),
 ):
     try:
-        return service.get_article(article_id)
+        article = service.get_article(article_id)
     except ArticleNotFoundError:
         raise HTTPException(status_code=404, detail="Article not found")
+    return conditional_json_response(request, article, _NEWS_CACHE_CONTROL)
@@ -1,20 +1,32 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemLoader
 
 from app.dependencies import get_workspace_service
 from app.services.workspace_service import WorkspaceService
 
 router = APIRouter(tags=["pages"])
-templates = Jinja2Templates(directory="app/templates")
+# Templates ship with the app and never change at runtime, so skip Jinja's
+# per-render stat of every template (and its includes) for auto-reload.
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader("app/templates"),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=400,
+    )
+)
 
 
 @router.get("/", response_class=HTMLResponse)
-def news_list_page(
+async def news_list_page(
     request: Request,
     workspace_service: WorkspaceService = Depends(get_workspace_service),
 ):
-    workspaces = workspace_service.list_workspaces()
+    workspaces = await asyncio.to_thread(workspace_service.list_workspaces)
     return templates.TemplateResponse(
         "news_list.html",
         {"request": request, "workspaces": workspaces},
@@ -22,11 +34,11 @@ def news_list_page(
 
 
 @router.get("/prompts", response_class=HTMLResponse)
-def prompts_page(
+async def prompts_page(
     request: Request,
     workspace_service: WorkspaceService = Depends(get_workspace_service),
 ):
-    workspaces = workspace_service.list_workspaces()
+    workspaces = await asyncio.to_thread(workspace_service.list_workspaces)
     return templates.TemplateResponse(
         "prompts.html",
         {"request": request, "workspaces": workspaces},
@@ -1,65 +1,68 @@
-from pathlib import Path
+import asyncio
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Request
 
-from app.dependencies import get_settings, get_workspace_service
+from app.dependencies import get_prompt_service
 from app.models.prompts import FewShotConfig, PromptConfig, SystemPromptConfig
+from app.routes.http_cache import conditional_json_response
 from app.services.prompt_service import PromptService
-from app.services.workspace_service import WorkspaceNotFoundError, WorkspaceService
 
 router = APIRouter(prefix="/workspaces/{workspace_id}/prompts", tags=["prompts"])
 
-
-def get_prompt_service(
-    workspace_id: str,
-    workspace_service: WorkspaceService = Depends(get_workspace_service),
-) -> PromptService:
-    settings = get_settings()
-    try:
-        workspace_service.get_workspace(workspace_id)
-    except WorkspaceNotFoundError:
-        raise HTTPException(status_code=404, detail="Workspace not found")
-    workspace_dir = Path(settings.workspaces_path) / workspace_id
-    return PromptService(workspace_dir)
+# Prompt configs are edited from the UI, so clients must revalidate on every
+# use. An unchanged config then costs a 304 instead of the full body.
+_PROMPT_CACHE_CONTROL = "private, no-cache"
 
 
 @router.get("/categories", response_model=PromptConfig)
-def get_categories(service: PromptService = Depends(get_prompt_service)):
-    return service.get_categories()
+async def get_categories(
+    request: Request,
+    service: PromptService = Depends(get_prompt_service),
+):
+    config = await asyncio.to_thread(service.get_categories)
+    return conditional_json_response(request, config, _PROMPT_CACHE_CONTROL)
 
 
 @router.put("/categories", response_model=PromptConfig)
-def save_categories(
+async def save_categories(
     config: PromptConfig,
     service: PromptService = Depends(get_prompt_service),
 ):
-    service.save_categories(config)
+    await asyncio.to_thread(service.save_categories, config)
     return config
 
 
 @router.get("/few-shots", response_model=FewShotConfig)
-def get_few_shots(service: PromptService = Depends(get_prompt_service)):
-    return service.get_few_shots()
+async def get_few_shots(
+    request: Request,
+    service: PromptService = Depends(get_prompt_service),
+):
+    config = await asyncio.to_thread(service.get_few_shots)
+    return conditional_json_response(request, config, _PROMPT_CACHE_CONTROL)
 
 
 @router.put("/few-shots", response_model=FewShotConfig)
-def save_few_shots(
+async def save_few_shots(
     config: FewShotConfig,
     service: PromptService = Depends(get_prompt_service),
 ):
-    service.save_few_shots(config)
+    await asyncio.to_thread(service.save_few_shots, config)
     return config
 
 
 @router.get("/system-prompt", response_model=SystemPromptConfig)
-def get_system_prompt(service: PromptService = Depends(get_prompt_service)):
-    return service.get_system_prompt()
+async def get_system_prompt(
+    request: Request,
+    service: PromptService = Depends(get_prompt_service),
+):
+    config = await asyncio.to_thread(service.get_system_prompt)
+    return conditional_json_response(request, config, _PROMPT_CACHE_CONTROL)
 
 
 @router.put("/system-prompt", response_model=SystemPromptConfig)
-def save_system_prompt(
+async def save_system_prompt(
     config: SystemPromptConfig,
     service: PromptService = Depends(get_prompt_service),
 ):
-    service.save_system_prompt(config)
+    await asyncio.to_thread(service.save_system_prompt, config)
     return config
@@ -1,37 +1,60 @@
-import json
-import uuid
+import asyncio
+import logging
+import secrets
 from datetime import datetime
-from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, TypeAdapter
 
 from app.agents.analysis_agent import AnalysisAgent
 from app.agents.chat_reasoning_agent import ChatReasoningAgent
 from app.agents.evaluation_agent import EvaluationAgent
 from app.agents.improvement_agent import ImprovementAgent
 from app.agents.llm_provider import get_llm
-from app.dependencies import get_settings, get_workspace_news_service, get_workspace_service
+from app.agents.response_cache import ResponseCache
+from app.config import Settings
+from app.dependencies import (
+    get_analysis_cache,
+    get_improvement_cache,
+    get_settings,
+    get_feedback_service,
+    get_prompt_service,
+    get_workspace_news_service,
+)
 from app.models.chat import ChatReasoningRequest
 from app.models.feedback import (
     AIInsight,
+    AIInsightWithUserAnalysis,
     EvaluationReport,
     Feedback,
+    FeedbackAccepted,
+    FeedbackEvaluationFailed,
     FeedbackWithHeadline,
     ImprovementSuggestion,
     ImprovementSuggestionResponse,
 )
+from app.models.prompts import CategoryDefinition, FewShotExample
 from app.services.feedback_service import FeedbackNotFoundError, FeedbackService
 from app.services.prompt_service import PromptService
 from app.services.workspace_news_service import (
     ArticleNotFoundError,
     WorkspaceNewsService,
 )
-from app.services.workspace_service import WorkspaceNotFoundError, WorkspaceService
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/workspaces/{workspace_id}", tags=["workflows"])
 
+_DONE_FRAME = b"data: " + orjson.dumps({"done": True}) + b"\n\n"
+
+# The feedback listings can hold thousands of rows that are already
+# validated models. Serializing them here skips FastAPI's response
+# revalidation pass. response_model is kept for the OpenAPI schema.
+_FEEDBACK_LIST_ADAPTER = TypeAdapter(list[Feedback])
+_FEEDBACK_WITH_HEADLINE_LIST_ADAPTER = TypeAdapter(list[FeedbackWithHeadline])
+
 
 class AnalyzeRequest(BaseModel):
     article_id: str
@@ -45,31 +68,26 @@ class FeedbackRequest(BaseModel):
     ai_insight: AIInsight
 
 
-@router.post("/analyze")
-def analyze_article(
+@router.post("/analyze", response_model=AIInsight | AIInsightWithUserAnalysis)
+async def analyze_article(
     workspace_id: str,
     request: AnalyzeRequest,
-    workspace_service: WorkspaceService = Depends(get_workspace_service),
+    prompt_service: PromptService = Depends(get_prompt_service),
     workspace_news_service: WorkspaceNewsService = Depends(get_workspace_news_service),
+    analysis_cache: ResponseCache = Depends(get_analysis_cache),
+    settings: Settings = Depends(get_settings),
 ):
-    settings = get_settings()
-
     try:
-        workspace_service.get_workspace(workspace_id)
-    except WorkspaceNotFoundError:
-        raise HTTPException(status_code=404, detail="Workspace not found")
-
-    try:
-        article = workspace_news_service.get_article(workspace_id, request.article_id)
+        article, (categories, few_shots), system_prompt_config = await asyncio.gather(
+            asyncio.to_thread(
+                workspace_news_service.get_article, workspace_id, request.article_id
+            ),
+            asyncio.to_thread(_load_prompt_examples, prompt_service),
+            asyncio.to_thread(prompt_service.get_system_prompt),
+        )
     except ArticleNotFoundError:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    workspace_dir = Path(settings.workspaces_path) / workspace_id
-    prompt_service = PromptService(workspace_dir)
-
-    categories = prompt_service.get_categories().categories
-    few_shots = prompt_service.get_few_shots().examples
-    system_prompt_config = prompt_service.get_system_prompt()
     custom_system_prompt = system_prompt_config.content if system_prompt_config.content else None
 
     if not categories:
@@ -78,34 +96,27 @@ def analyze_article(
             detail="No categories defined in workspace. Please add at least one category before analyzing articles.",
         )
 
-    with open(settings.system_prompt_path) as f:
-        system_prompt = f.read()
-
     llm = get_llm(settings)
-    agent = AnalysisAgent(llm=llm, system_prompt=system_prompt)
+    agent = AnalysisAgent(
+        llm=llm, system_prompt=settings.system_prompt_text, cache=analysis_cache
+    )
 
-    return agent.analyze(categories, few_shots, article.content, custom_system_prompt)
+    return await agent.aanalyze(categories, few_shots, article.content, custom_system_prompt)
 
 
-@router.post("/feedback", response_model=EvaluationReport)
-def submit_feedback(
-    workspace_id: str,
+@router.post("/feedback", response_model=EvaluationReport | FeedbackAccepted)
+async def submit_feedback(
     request: FeedbackRequest,
-    workspace_service: WorkspaceService = Depends(get_workspace_service),
+    response: Response,
+    background_tasks: BackgroundTasks,
+    wait: bool = False,
+    prompt_service: PromptService = Depends(get_prompt_service),
+    feedback_service: FeedbackService = Depends(get_feedback_service),
+    settings: Settings = Depends(get_settings),
 ):
-    settings = get_settings()
-
-    try:
-        workspace_service.get_workspace(workspace_id)
-    except WorkspaceNotFoundError:
-        raise HTTPException(status_code=404, detail="Workspace not found")
-
-    workspace_dir = Path(settings.workspaces_path) / workspace_id
-    prompt_service = PromptService(workspace_dir)
-    feedback_service = FeedbackService(workspace_dir)
-
-    feedback = Feedback(
-        id=f"fb-{uuid.uuid4().hex[:8]}",
+    # Every field comes from the validated request or is generated here.
+    feedback = Feedback.model_construct(
+        id=f"fb-{secrets.token_hex(4)}",
         article_id=request.article_id,
         thumbs_up=request.thumbs_up,
         correct_category=request.correct_category,
@@ -113,76 +124,93 @@ def submit_feedback(
         ai_insight=request.ai_insight,
         created_at=datetime.now(),
     )
-    feedback_service.save_feedback(feedback)
+    _, (categories, few_shots) = await asyncio.gather(
+        asyncio.to_thread(feedback_service.save_feedback, feedback),
+        asyncio.to_thread(_load_prompt_examples, prompt_service),
+    )
+
+    if wait:
+        return await _run_evaluation(
+            feedback, categories, few_shots, feedback_service, settings
+        )
 
-    categories = prompt_service.get_categories().categories
-    few_shots = prompt_service.get_few_shots().examples
+    # The evaluation is an LLM round trip; acknowledge the feedback now and
+    # let clients fetch the report from /feedback/{id}/evaluation.
+    await asyncio.to_thread(feedback_service.mark_evaluation_pending, feedback.id)
+    background_tasks.add_task(
+        _run_background_evaluation,
+        feedback,
+        categories,
+        few_shots,
+        feedback_service,
+        settings,
+    )
+    response.status_code = 202
+    return FeedbackAccepted(feedback_id=feedback.id)
+
+
+@router.get(
+    "/feedback/{feedback_id}/evaluation",
+    response_model=EvaluationReport | FeedbackEvaluationFailed | FeedbackAccepted,
+    responses={
+        200: {"description": "The evaluation report, or status \"failed\" if it errored"},
+        202: {"model": FeedbackAccepted, "description": "The evaluation is still running"},
+        404: {"description": "Feedback not found"},
+    },
+)
+async def get_feedback_evaluation(
+    feedback_id: str,
+    response: Response,
+    feedback_service: FeedbackService = Depends(get_feedback_service),
+):
+    report = await asyncio.to_thread(
+        feedback_service.get_evaluation_report_for_feedback, feedback_id
+    )
+    if report is not None:
+        return report
 
-    llm = get_llm(settings)
-    agent = EvaluationAgent(llm=llm)
-    report = agent.evaluate(feedback, categories, few_shots)
+    error = await asyncio.to_thread(feedback_service.get_evaluation_error, feedback_id)
+    if error is not None:
+        return FeedbackEvaluationFailed(feedback_id=feedback_id, error=error)
 
-    feedback_service.save_evaluation_report(report)
+    if not await asyncio.to_thread(feedback_service.has_feedback, feedback_id):
+        raise HTTPException(status_code=404, detail="Feedback not found")
 
-    return report
+    response.status_code = 202
+    return FeedbackAccepted(feedback_id=feedback_id)
 
 
 @router.get("/feedback", response_model=list[Feedback])
-def list_feedback(
-    workspace_id: str,
-    workspace_service: WorkspaceService = Depends(get_workspace_service),
+async def list_feedback(
+    feedback_service: FeedbackService = Depends(get_feedback_service),
 ):
-    settings = get_settings()
-
-    try:
-        workspace_service.get_workspace(workspace_id)
-    except WorkspaceNotFoundError:
-        raise HTTPException(status_code=404, detail="Workspace not found")
+    feedbacks = await asyncio.to_thread(feedback_service.list_feedback)
 
-    workspace_dir = Path(settings.workspaces_path) / workspace_id
-    feedback_service = FeedbackService(workspace_dir)
-
-    return feedback_service.list_feedback()
+    return _json_response(_FEEDBACK_LIST_ADAPTER.dump_json(feedbacks))
 
 
 @router.get("/feedback-with-headlines", response_model=list[FeedbackWithHeadline])
-def list_feedback_with_headlines(
+async def list_feedback_with_headlines(
     workspace_id: str,
-    workspace_service: WorkspaceService = Depends(get_workspace_service),
+    feedback_service: FeedbackService = Depends(get_feedback_service),
     workspace_news_service: WorkspaceNewsService = Depends(get_workspace_news_service),
 ):
-    settings = get_settings()
+    feedbacks = await asyncio.to_thread(feedback_service.list_feedback)
 
-    try:
-        workspace_service.get_workspace(workspace_id)
-    except WorkspaceNotFoundError:
-        raise HTTPException(status_code=404, detail="Workspace not found")
-
-    workspace_dir = Path(settings.workspaces_path) / workspace_id
-    feedback_service = FeedbackService(workspace_dir)
-    feedbacks = feedback_service.list_feedback()
+    enriched = await asyncio.to_thread(
+        _enrich_feedbacks_with_headlines, feedbacks, workspace_id, workspace_news_service
+    )
 
-    return _enrich_feedbacks_with_headlines(feedbacks, workspace_id, workspace_news_service)
+    return _json_response(_FEEDBACK_WITH_HEADLINE_LIST_ADAPTER.dump_json(enriched))
 
 
-@router.delete("/feedback/{feedback_id}")
-def delete_feedback(
-    workspace_id: str,
+@router.delete("/feedback/{feedback_id}", response_model=dict[str, str])
+async def delete_feedback(
     feedback_id: str,
-    workspace_service: WorkspaceService = Depends(get_workspace_service),
+    feedback_service: FeedbackService = Depends(get_feedback_service),
 ):
-    settings = get_settings()
-
     try:
-        workspace_service.get_workspace(workspace_id)
-    except WorkspaceNotFoundError:
-        raise HTTPException(status_code=404, detail="Workspace not found")
-
-    workspace_dir = Path(settings.workspaces_path) / workspace_id
-    feedback_service = FeedbackService(workspace_dir)
-
-    try:
-        feedback_service.delete_feedback(feedback_id)
+        await asyncio.to_thread(feedback_service.delete_feedback, feedback_id)
     except FeedbackNotFoundError:
         raise HTTPException(status_code=404, detail="Feedback not found")
 
@@ -190,36 +218,31 @@ def delete_feedback(
 
 
 @router.post("/suggest-improvements", response_model=ImprovementSuggestionResponse)
-def suggest_improvements(
+async def suggest_improvements(
     workspace_id: str,
-    workspace_service: WorkspaceService = Depends(get_workspace_service),
+    prompt_service: PromptService = Depends(get_prompt_service),
+    feedback_service: FeedbackService = Depends(get_feedback_service),
     workspace_news_service: WorkspaceNewsService = Depends(get_workspace_news_service),
+    improvement_cache: ResponseCache = Depends(get_improvement_cache),
+    settings: Settings = Depends(get_settings),
 ):
-    settings = get_settings()
-
-    try:
-        workspace_service.get_workspace(workspace_id)
-    except WorkspaceNotFoundError:
-        raise HTTPException(status_code=404, detail="Workspace not found")
-
-    workspace_dir = Path(settings.workspaces_path) / workspace_id
-    prompt_service = PromptService(workspace_dir)
-    feedback_service = FeedbackService(workspace_dir)
-
-    categories = prompt_service.get_categories().categories
-    few_shots = prompt_service.get_few_shots().examples
-    feedbacks = feedback_service.list_feedback()
+    (categories, few_shots), feedbacks = await asyncio.gather(
+        asyncio.to_thread(_load_prompt_examples, prompt_service),
+        asyncio.to_thread(feedback_service.list_feedback),
+    )
 
     if not feedbacks:
         raise HTTPException(status_code=400, detail="No feedback available")
 
-    feedbacks_with_headlines = _enrich_feedbacks_with_headlines(
-        feedbacks, workspace_id, workspace_news_service
+    feedbacks_with_headlines = await asyncio.to_thread(
+        _enrich_feedbacks_with_headlines, feedbacks, workspace_id, workspace_news_service
     )
 
     llm = get_llm(settings)
-    agent = ImprovementAgent(llm=llm)
-    suggestions = agent.suggest_improvements(feedbacks_with_headlines, categories, few_shots)
+    agent = ImprovementAgent(llm=llm, cache=improvement_cache)
+    suggestions = await agent.asuggest_improvements(
+        feedbacks_with_headlines, categories, few_shots
+    )
 
     return ImprovementSuggestionResponse(
         suggestions=suggestions,
@@ -227,23 +250,93 @@ def suggest_improvements(
     )
 
 
+async def _run_evaluation(
+    feedback: Feedback,
+    categories: list[CategoryDefinition],
+    few_shots: list[FewShotExample],
+    feedback_service: FeedbackService,
+    settings: Settings,
+) -> EvaluationReport:
+    try:
+        llm = get_llm(settings)
+        agent = EvaluationAgent(llm=llm)
+        report = await agent.aevaluate(feedback, categories, few_shots)
+    except Exception as exc:
+        # Provider errors can quote endpoints, keys or request bodies, so
+        # clients only see the exception type; the log keeps the details.
+        await asyncio.to_thread(
+            _mark_failed_unless_deleted, feedback_service, feedback.id, type(exc).__name__
+        )
+        raise
+
+    await asyncio.to_thread(_save_report_unless_deleted, feedback_service, report)
+
+    return report
+
+
+async def _run_background_evaluation(
+    feedback: Feedback,
+    categories: list[CategoryDefinition],
+    few_shots: list[FewShotExample],
+    feedback_service: FeedbackService,
+    settings: Settings,
+) -> None:
+    # The response has already been sent, so a failure is logged here and
+    # reported to clients through the recorded status.
+    try:
+        await _run_evaluation(feedback, categories, few_shots, feedback_service, settings)
+    except Exception:
+        logger.exception("Background evaluation failed for feedback %s", feedback.id)
+
+
+# The feedback may be deleted while its evaluation is in flight; writing the
+# outcome afterwards would leave orphaned report and status files.
+def _save_report_unless_deleted(
+    feedback_service: FeedbackService, report: EvaluationReport
+) -> None:
+    if feedback_service.has_feedback(report.feedback_id):
+        feedback_service.save_evaluation_report(report)
+
+
+def _mark_failed_unless_deleted(
+    feedback_service: FeedbackService, feedback_id: str, error: str
+) -> None:
+    if feedback_service.has_feedback(feedback_id):
+        feedback_service.mark_evaluation_failed(feedback_id, error)
+
+
+def _json_response(content: bytes) -> Response:
+    return Response(content=content, media_type="application/json")
+
+
+def _load_prompt_examples(
+    prompt_service: PromptService,
+) -> tuple[list[CategoryDefinition], list[FewShotExample]]:
+    return prompt_service.get_categories().categories, prompt_service.get_few_shots().examples
+
+
 def _enrich_feedbacks_with_headlines(
     feedbacks: list[Feedback],
     workspace_id: str,
     workspace_news_service: WorkspaceNewsService,
 ) -> list[FeedbackWithHeadline]:
+    articles = workspace_news_service.get_articles_bulk(
+        workspace_id, [feedback.article_id for feedback in feedbacks]
+    )
+
     enriched = []
     for feedback in feedbacks:
-        try:
-            article = workspace_news_service.get_article(workspace_id, feedback.article_id)
+        article = articles.get(feedback.article_id)
+        if article is not None:
             headline = article.headline
             content = article.content
-        except ArticleNotFoundError:
+        else:
             headline = f"Article {feedback.article_id} (not found)"
             content = ""
 
+        # Fields are copied from already-validated Feedback and article models.
         enriched.append(
-            FeedbackWithHeadline(
+            FeedbackWithHeadline.model_construct(
                 id=feedback.id,
                 article_id=feedback.article_id,
                 article_headline=headline,
@@ -259,35 +352,28 @@ def _enrich_feedbacks_with_headlines(
 
 
 @router.post("/chat-reasoning")
-def chat_reasoning(
+async def chat_reasoning(
     workspace_id: str,
     request: ChatReasoningRequest,
-    workspace_service: WorkspaceService = Depends(get_workspace_service),
+    prompt_service: PromptService = Depends(get_prompt_service),
     workspace_news_service: WorkspaceNewsService = Depends(get_workspace_news_service),
+    settings: Settings = Depends(get_settings),
 ):
-    settings = get_settings()
-
-    try:
-        workspace_service.get_workspace(workspace_id)
-    except WorkspaceNotFoundError:
-        raise HTTPException(status_code=404, detail="Workspace not found")
-
     try:
-        article = workspace_news_service.get_article(workspace_id, request.article_id)
+        article, (categories, few_shots) = await asyncio.gather(
+            asyncio.to_thread(
+                workspace_news_service.get_article, workspace_id, request.article_id
+            ),
+            asyncio.to_thread(_load_prompt_examples, prompt_service),
+        )
     except ArticleNotFoundError:
         raise HTTPException(status_code=404, detail="Article not found")
 
-    workspace_dir = Path(settings.workspaces_path) / workspace_id
-    prompt_service = PromptService(workspace_dir)
-
-    categories = prompt_service.get_categories().categories
-    few_shots = prompt_service.get_few_shots().examples
-
     llm = get_llm(settings)
     agent = ChatReasoningAgent(llm=llm)
 
-    def generate():
-        for token in agent.stream(
+    async def generate():
+        async for token in agent.astream(
             article_content=article.content,
             categories=categories,
             few_shots=few_shots,
@@ -295,8 +381,8 @@ def chat_reasoning(
             chat_history=request.chat_history,
             message=request.message,
         ):
-            yield f"data: {json.dumps({'token': token})}\n\n"
-        yield f"data: {json.dumps({'done': True})}\n\n"
+            yield b"data: " + orjson.dumps({"token": token}) + b"\n\n"
+        yield _DONE_FRAME
 
     return StreamingResponse(
         generate(),
@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from pydantic import BaseModel
 
@@ -51,7 +53,7 @@ async def upload_csv(
     service: WorkspaceNewsService = Depends(get_workspace_news_service),
 ):
     try:
-        count = service.upload_csv(workspace_id, file.file)
+        count = await asyncio.to_thread(service.upload_csv, workspace_id, file.file)
         return UploadCSVResponse(count=count, message=f"{count} articles uploaded")
     except CSVValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
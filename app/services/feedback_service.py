@@ -1,7 +1,25 @@
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from app.models.feedback import EvaluationReport, Feedback
+from app.services.jsonio import dump_json, load_json, load_model
+
+# Listings read one small file per entry. The reads are independent and
+# release the GIL, so a shared pool overlaps them across files.
+_IO_POOL = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+
+
+def _json_files(directory: Path) -> list[str]:
+    # scandir reports the entry type from the directory listing itself,
+    # avoiding Path.glob's per-entry Path objects and stat calls.
+    with os.scandir(directory) as entries:
+        return [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
 
 
 class FeedbackNotFoundError(Exception):
@@ -15,17 +33,21 @@ class FeedbackService:
         self.workspace_dir = Path(workspace_dir)
         self.feedback_dir = self.workspace_dir / "feedback"
         self.reports_dir = self.workspace_dir / "evaluation_reports"
+        # One small file per feedback id recording where its evaluation
+        # stands, so lookups don't scan every report.
+        self.status_dir = self.workspace_dir / "evaluation_status"
 
     def save_feedback(self, feedback: Feedback) -> None:
         file_path = self.feedback_dir / f"{feedback.id}.json"
-        with open(file_path, "w") as f:
-            json.dump(feedback.model_dump(mode="json"), f, indent=2)
+        dump_json(file_path, feedback.model_dump(mode="json"))
+
+    def has_feedback(self, feedback_id: str) -> bool:
+        return (self.feedback_dir / f"{feedback_id}.json").exists()
 
     def list_feedback(self) -> list[Feedback]:
-        feedbacks = []
-        for file_path in self.feedback_dir.glob("*.json"):
-            with open(file_path) as f:
-                feedbacks.append(Feedback.model_validate(json.load(f)))
+        feedbacks = _IO_POOL.map(
+            partial(load_model, model=Feedback), _json_files(self.feedback_dir)
+        )
         return sorted(feedbacks, key=lambda fb: fb.created_at, reverse=True)
 
     def delete_feedback(self, feedback_id: str) -> None:
@@ -37,21 +59,69 @@ class FeedbackService:
         self._delete_evaluation_report_for_feedback(feedback_id)
 
     def _delete_evaluation_report_for_feedback(self, feedback_id: str) -> None:
-        for file_path in self.reports_dir.glob("*.json"):
-            with open(file_path) as f:
-                report = EvaluationReport.model_validate(json.load(f))
-            if report.feedback_id == feedback_id:
-                file_path.unlink()
-                break
+        file_path = self._evaluation_report_file(feedback_id)
+        if file_path is not None and os.path.exists(file_path):
+            os.unlink(file_path)
+        self._status_path(feedback_id).unlink(missing_ok=True)
+
+    def _status_path(self, feedback_id: str) -> Path:
+        return self.status_dir / f"{feedback_id}.json"
+
+    def _load_status(self, feedback_id: str) -> dict | None:
+        try:
+            return load_json(self._status_path(feedback_id))
+        except FileNotFoundError:
+            return None
+
+    def _save_status(self, feedback_id: str, status: dict) -> None:
+        self.status_dir.mkdir(exist_ok=True)
+        dump_json(self._status_path(feedback_id), status)
+
+    def _evaluation_report_file(self, feedback_id: str) -> str | None:
+        status = self._load_status(feedback_id)
+        if status is None:
+            # Reports saved before evaluations were indexed.
+            return self._find_evaluation_report_file(feedback_id)
+        if status.get("report_id") is None:
+            return None
+        return str(self.reports_dir / f"{status['report_id']}.json")
+
+    def _find_evaluation_report_file(self, feedback_id: str) -> str | None:
+        # Only feedback_id is needed to match, so reports are parsed as plain
+        # JSON here and the caller validates just the one it wants.
+        for file_path in _json_files(self.reports_dir):
+            if load_json(file_path).get("feedback_id") == feedback_id:
+                return file_path
+        return None
 
     def save_evaluation_report(self, report: EvaluationReport) -> None:
         file_path = self.reports_dir / f"{report.id}.json"
-        with open(file_path, "w") as f:
-            json.dump(report.model_dump(), f, indent=2)
+        dump_json(file_path, report.model_dump(mode="json"))
+        self._save_status(report.feedback_id, {"status": "complete", "report_id": report.id})
+
+    def mark_evaluation_pending(self, feedback_id: str) -> None:
+        self._save_status(feedback_id, {"status": "pending"})
+
+    def mark_evaluation_failed(self, feedback_id: str, error: str) -> None:
+        self._save_status(feedback_id, {"status": "failed", "error": error})
+
+    def get_evaluation_report_for_feedback(
+        self, feedback_id: str
+    ) -> EvaluationReport | None:
+        file_path = self._evaluation_report_file(feedback_id)
+        if file_path is None:
+            return None
+        return load_model(file_path, EvaluationReport)
+
+    def get_evaluation_error(self, feedback_id: str) -> str | None:
+        status = self._load_status(feedback_id)
+        if status is None or status.get("status") != "failed":
+            return None
+        return status["error"]
 
     def list_evaluation_reports(self) -> list[EvaluationReport]:
-        reports = []
-        for file_path in self.reports_dir.glob("*.json"):
-            with open(file_path) as f:
-                reports.append(EvaluationReport.model_validate(json.load(f)))
-        return reports
+        return list(
+            _IO_POOL.map(
+                partial(load_model, model=EvaluationReport), _json_files(self.reports_dir)
+            )
+        )
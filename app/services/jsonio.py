@@ -0,0 +1,26 @@
+from pathlib import Path
+from typing import Any, TypeVar
+
+import orjson
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def file_signature(path: str | Path) -> tuple[int, int]:
+    """(mtime_ns, size) of a file, for telling whether a cached parse is stale."""
+    stat = Path(path).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_json(path: str | Path) -> Any:
+    return orjson.loads(Path(path).read_bytes())
+
+
+def load_model(path: str | Path, model: type[ModelT]) -> ModelT:
+    """Parse and validate a JSON file in one pass, without an intermediate dict."""
+    return model.model_validate_json(Path(path).read_bytes())
+
+
+def dump_json(path: str | Path, data: Any) -> None:
+    Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
@@ -16,18 +16,26 @@ class NewsService:
     def __init__(self, csv_path: Path):
         self.csv_path = Path(csv_path)
         self._articles: list[NewsArticle] | None = None
+        self._articles_by_id: dict[str, NewsArticle] = {}
 
     def _load_articles(self) -> list[NewsArticle]:
         if self._articles is None:
-            self._articles = []
+            articles = []
             with open(self.csv_path, newline="") as f:
                 reader = csv.DictReader(f)
                 for row in reader:
-                    self._articles.append(NewsArticle(
+                    articles.append(NewsArticle(
                         id=row["id"],
                         headline=row["headline"],
                         content=row["content"],
                     ))
+            # Publish the index before the list so a concurrent reader never
+            # sees a loaded list with a partial index.
+            by_id: dict[str, NewsArticle] = {}
+            for article in articles:
+                by_id.setdefault(article.id, article)
+            self._articles_by_id = by_id
+            self._articles = articles
         return self._articles
 
     def get_news(self, page: int, limit: int) -> NewsListResponse:
@@ -46,8 +54,8 @@ class NewsService:
         )
 
     def get_article(self, article_id: str) -> NewsArticle:
-        articles = self._load_articles()
-        for article in articles:
-            if article.id == article_id:
-                return article
-        raise ArticleNotFoundError(article_id)
+        self._load_articles()
+        try:
+            return self._articles_by_id[article_id]
+        except KeyError:
+            raise ArticleNotFoundError(article_id)
@@ -1,7 +1,12 @@
-import json
 from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel
 
 from app.models.prompts import FewShotConfig, PromptConfig, SystemPromptConfig
+from app.services.jsonio import dump_json, file_signature, load_model
+
+ConfigT = TypeVar("ConfigT", bound=BaseModel)
 
 
 class PromptService:
@@ -10,29 +15,44 @@ class PromptService:
         self.categories_file = self.workspace_dir / "category_definitions.json"
         self.few_shots_file = self.workspace_dir / "few_shot_examples.json"
         self.system_prompt_file = self.workspace_dir / "system_prompt.json"
+        # Parsed configs keyed by file path and tagged with (mtime_ns, size),
+        # so a stat() tells whether a cached parse is still current. One
+        # instance is shared per workspace (see app.dependencies), which bounds
+        # this to the workspaces that provider keeps.
+        self._config_cache: dict[Path, tuple[tuple[int, int], BaseModel]] = {}
+
+    def _read_config(self, path: Path, model: type[ConfigT]) -> ConfigT:
+        # Callers get a deep copy so edits to a returned config never reach
+        # the cached parse.
+        signature = file_signature(path)
+        cached = self._config_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1].model_copy(deep=True)
+
+        config = load_model(path, model)
+        self._config_cache[path] = (signature, config)
+        return config.model_copy(deep=True)
+
+    def _write_config(self, path: Path, config: BaseModel) -> None:
+        dump_json(path, config.model_dump(mode="json"))
+        self._config_cache[path] = (file_signature(path), config.model_copy(deep=True))
 
     def get_categories(self) -> PromptConfig:
-        with open(self.categories_file) as f:
-            return PromptConfig.model_validate(json.load(f))
+        return self._read_config(self.categories_file, PromptConfig)
 
     def save_categories(self, config: PromptConfig) -> None:
-        with open(self.categories_file, "w") as f:
-            json.dump(config.model_dump(), f, indent=2)
+        self._write_config(self.categories_file, config)
 
     def get_few_shots(self) -> FewShotConfig:
-        with open(self.few_shots_file) as f:
-            return FewShotConfig.model_validate(json.load(f))
+        return self._read_config(self.few_shots_file, FewShotConfig)
 
     def save_few_shots(self, config: FewShotConfig) -> None:
-        with open(self.few_shots_file, "w") as f:
-            json.dump(config.model_dump(), f, indent=2)
+        self._write_config(self.few_shots_file, config)
 
     def get_system_prompt(self) -> SystemPromptConfig:
         if not self.system_prompt_file.exists():
             return SystemPromptConfig(content="")
-        with open(self.system_prompt_file) as f:
-            return SystemPromptConfig.model_validate(json.load(f))
+        return self._read_config(self.system_prompt_file, SystemPromptConfig)
 
     def save_system_prompt(self, config: SystemPromptConfig) -> None:
-        with open(self.system_prompt_file, "w") as f:
-            json.dump(config.model_dump(), f, indent=2)
+        self._write_config(self.system_prompt_file, config)
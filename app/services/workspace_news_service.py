@@ -1,12 +1,20 @@
 import csv
 import io
-import json
-import uuid
+import secrets
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import BinaryIO
 
 from app.models.news import NewsArticle, NewsListResponse, NewsSource
 from app.models.workspace import WorkspaceMetadata
+from app.services.jsonio import dump_json, file_signature, load_model
+
+# Parsed per-workspace files kept by one (process-wide) service instance.
+# Least recently used workspaces drop out, so deleted ones don't linger.
+_MAX_CACHED_WORKSPACES = 128
 
 
 class CSVValidationError(Exception):
@@ -22,10 +30,69 @@ class ArticleNotFoundError(Exception):
         super().__init__(f"Article not found: {article_id}")
 
 
+def _read_news_csv(path: Path) -> list[NewsArticle]:
+    articles = []
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            articles.append(NewsArticle(
+                id=row["id"],
+                headline=row["headline"],
+                content=row["content"],
+                date=row.get("date")
+            ))
+    return articles
+
+
+_cache_lock = threading.Lock()
+
+
+def _recall(cache: OrderedDict, key: str, signature: tuple[int, int]) -> tuple | None:
+    with _cache_lock:
+        cached = cache.get(key)
+        if cached is None or cached[0] != signature:
+            return None
+        cache.move_to_end(key)
+        return cached
+
+
+def _remember(cache: OrderedDict, key: str, value: tuple) -> None:
+    with _cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _MAX_CACHED_WORKSPACES:
+            cache.popitem(last=False)
+
+
+def _forget(cache: OrderedDict, key: str) -> None:
+    with _cache_lock:
+        cache.pop(key, None)
+
+
+def _index_by_id(articles: list[NewsArticle]) -> dict[str, NewsArticle]:
+    # Keep the first article for an id, matching a front-to-back scan.
+    by_id: dict[str, NewsArticle] = {}
+    for article in articles:
+        by_id.setdefault(article.id, article)
+    return by_id
+
+
 class WorkspaceNewsService:
     def __init__(self, workspaces_path: Path, default_news_path: Path):
         self.workspaces_path = Path(workspaces_path)
         self.default_news_path = Path(default_news_path)
+        # The default news CSV is read-only configuration, parsed once per
+        # instance as NewsService does.
+        self._default_news: list[NewsArticle] | None = None
+        self._default_news_by_id: dict[str, NewsArticle] | None = None
+        # Per-workspace files are cached against their (mtime_ns, size), so a
+        # stat() per request replaces re-reading and re-parsing them.
+        self._metadata_cache: OrderedDict[
+            str, tuple[tuple[int, int], WorkspaceMetadata]
+        ] = OrderedDict()
+        self._uploaded_news_cache: OrderedDict[
+            str, tuple[tuple[int, int], list[NewsArticle], dict[str, NewsArticle]]
+        ] = OrderedDict()
 
     def _get_uploaded_news_path(self, workspace_id: str) -> Path:
         return self.workspaces_path / workspace_id / "uploaded_news.csv"
@@ -34,12 +101,20 @@ class WorkspaceNewsService:
         return self.workspaces_path / workspace_id / "metadata.json"
 
     def _load_metadata(self, workspace_id: str) -> WorkspaceMetadata:
-        with open(self._get_metadata_path(workspace_id)) as f:
-            return WorkspaceMetadata.model_validate(json.load(f))
+        metadata_path = self._get_metadata_path(workspace_id)
+        signature = file_signature(metadata_path)
+
+        cached = _recall(self._metadata_cache, workspace_id, signature)
+        if cached is not None:
+            return cached[1].model_copy()
+
+        metadata = load_model(metadata_path, WorkspaceMetadata)
+        _remember(self._metadata_cache, workspace_id, (signature, metadata))
+        return metadata.model_copy()
 
     def _save_metadata(self, workspace_id: str, metadata: WorkspaceMetadata) -> None:
-        with open(self._get_metadata_path(workspace_id), "w") as f:
-            json.dump(metadata.model_dump(mode="json"), f, indent=2)
+        dump_json(self._get_metadata_path(workspace_id), metadata.model_dump(mode="json"))
+        _forget(self._metadata_cache, workspace_id)
 
     def get_news_source(self, workspace_id: str) -> NewsSource:
         metadata = self._load_metadata(workspace_id)
@@ -51,36 +126,38 @@ class WorkspaceNewsService:
         self._save_metadata(workspace_id, metadata)
 
     def _load_default_news(self) -> list[NewsArticle]:
-        articles = []
-        with open(self.default_news_path, newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                articles.append(NewsArticle(
-                    id=row["id"],
-                    headline=row["headline"],
-                    content=row["content"],
-                    date=row.get("date")
-                ))
-        return articles
+        if self._default_news is None:
+            self._default_news = _read_news_csv(self.default_news_path)
+        return self._default_news
 
-    def _load_uploaded_news(self, workspace_id: str) -> list[NewsArticle]:
-        csv_path = self._get_uploaded_news_path(workspace_id)
-        if not csv_path.exists():
-            return []
+    def _load_default_news_index(self) -> dict[str, NewsArticle]:
+        if self._default_news_by_id is None:
+            self._default_news_by_id = _index_by_id(self._load_default_news())
+        return self._default_news_by_id
 
-        articles = []
-        with open(csv_path, newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                articles.append(NewsArticle(
-                    id=row["id"],
-                    headline=row["headline"],
-                    content=row["content"],
-                    date=row.get("date")
-                ))
-        return articles
+    def _load_uploaded_news(self, workspace_id: str) -> list[NewsArticle]:
+        return self._load_uploaded_news_with_index(workspace_id)[0]
 
-    def get_news(self, workspace_id: str, page: int, limit: int) -> NewsListResponse:
+    def _load_uploaded_news_with_index(
+        self, workspace_id: str
+    ) -> tuple[list[NewsArticle], dict[str, NewsArticle]]:
+        csv_path = self._get_uploaded_news_path(workspace_id)
+        try:
+            signature = file_signature(csv_path)
+        except FileNotFoundError:
+            _forget(self._uploaded_news_cache, workspace_id)
+            return [], {}
+
+        cached = _recall(self._uploaded_news_cache, workspace_id, signature)
+        if cached is not None:
+            return cached[1], cached[2]
+
+        articles = _read_news_csv(csv_path)
+        by_id = _index_by_id(articles)
+        _remember(self._uploaded_news_cache, workspace_id, (signature, articles, by_id))
+        return articles, by_id
+
+    def _load_articles(self, workspace_id: str) -> list[NewsArticle]:
         news_source = self.get_news_source(workspace_id)
         uploaded = self._load_uploaded_news(workspace_id)
 
@@ -90,6 +167,10 @@ class WorkspaceNewsService:
             articles = self._load_default_news()
         else:  # MERGE
             articles = uploaded + self._load_default_news()
+        return articles
+
+    def get_news(self, workspace_id: str, page: int, limit: int) -> NewsListResponse:
+        articles = self._load_articles(workspace_id)
 
         total = len(articles)
         start = (page - 1) * limit
@@ -103,27 +184,47 @@ class WorkspaceNewsService:
             limit=limit
         )
 
-    def get_article(self, workspace_id: str, article_id: str) -> NewsArticle:
+    def _load_article_indexes(self, workspace_id: str) -> list[dict[str, NewsArticle]]:
+        """Id lookups for the workspace's news, in the order `_load_articles` lists them."""
         news_source = self.get_news_source(workspace_id)
-        uploaded = self._load_uploaded_news(workspace_id)
+        uploaded, uploaded_by_id = self._load_uploaded_news_with_index(workspace_id)
 
         if news_source == NewsSource.REPLACE and uploaded:
-            articles = uploaded
+            return [uploaded_by_id]
         elif news_source == NewsSource.REPLACE and not uploaded:
-            articles = self._load_default_news()
+            return [self._load_default_news_index()]
         else:  # MERGE
-            articles = uploaded + self._load_default_news()
+            return [uploaded_by_id, self._load_default_news_index()]
 
-        for article in articles:
-            if article.id == article_id:
+    def get_article(self, workspace_id: str, article_id: str) -> NewsArticle:
+        for index in self._load_article_indexes(workspace_id):
+            article = index.get(article_id)
+            if article is not None:
                 return article
 
         raise ArticleNotFoundError(article_id)
 
+    def get_articles_bulk(
+        self, workspace_id: str, article_ids: list[str]
+    ) -> dict[str, NewsArticle]:
+        """Look up several articles with one load of the workspace's news.
+
+        Ids that do not resolve are left out of the result.
+        """
+        indexes = self._load_article_indexes(workspace_id)
+        found: dict[str, NewsArticle] = {}
+        for article_id in set(article_ids):
+            for index in indexes:
+                article = index.get(article_id)
+                if article is not None:
+                    found[article_id] = article
+                    break
+        return found
+
     def add_article(
         self, workspace_id: str, headline: str, content: str, date: str
     ) -> NewsArticle:
-        article_id = f"uploaded-{uuid.uuid4().hex[:8]}"
+        article_id = f"uploaded-{secrets.token_hex(4)}"
         article = NewsArticle(
             id=article_id,
             headline=headline,
@@ -144,13 +245,19 @@ class WorkspaceNewsService:
                 "content": article.content,
                 "date": article.date
             })
+        _forget(self._uploaded_news_cache, workspace_id)
 
         return article
 
     def upload_csv(self, workspace_id: str, file: BinaryIO) -> int:
-        content = file.read().decode("utf-8")
-        reader = csv.DictReader(io.StringIO(content))
-
+        text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+        try:
+            return self._append_csv_rows(workspace_id, csv.DictReader(text))
+        finally:
+            # Leave the caller's binary file open.
+            text.detach()
+
+    def _append_csv_rows(self, workspace_id: str, reader: csv.DictReader) -> int:
         if reader.fieldnames is None:
             raise CSVValidationError("CSV file is empty or has no header")
 
@@ -161,30 +268,31 @@ class WorkspaceNewsService:
                 f"CSV must have columns: {', '.join(sorted(missing_columns))}"
             )
 
-        rows = list(reader)
-        if not rows:
-            raise CSVValidationError("CSV file is empty - no data rows")
-
+        fieldnames = ["id", "headline", "content", "date"]
         seen_ids: set[str] = set()
-        for row in rows:
-            article_id = row["id"]
-            if article_id in seen_ids:
-                raise CSVValidationError(f"Duplicate id '{article_id}' found in CSV")
-            seen_ids.add(article_id)
-
-        csv_path = self._get_uploaded_news_path(workspace_id)
-        file_exists = csv_path.exists()
 
-        with open(csv_path, "a", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=["id", "headline", "content", "date"])
-            if not file_exists:
-                writer.writeheader()
-            for row in rows:
-                writer.writerow({
-                    "id": row["id"],
-                    "headline": row["headline"],
-                    "content": row["content"],
-                    "date": row["date"]
-                })
-
-        return len(rows)
+        # Validate and spool rows in a single pass over the upload. The
+        # workspace CSV is only touched once every row has passed validation.
+        with tempfile.TemporaryFile("w+", newline="") as spool:
+            writer = csv.DictWriter(spool, fieldnames=fieldnames, extrasaction="ignore")
+            for row in reader:
+                article_id = row["id"]
+                if article_id in seen_ids:
+                    raise CSVValidationError(f"Duplicate id '{article_id}' found in CSV")
+                seen_ids.add(article_id)
+                writer.writerow(row)
+
+            if not seen_ids:
+                raise CSVValidationError("CSV file is empty - no data rows")
+
+            csv_path = self._get_uploaded_news_path(workspace_id)
+            file_exists = csv_path.exists()
+
+            spool.seek(0)
+            with open(csv_path, "a", newline="") as f:
+                if not file_exists:
+                    csv.DictWriter(f, fieldnames=fieldnames).writeheader()
+                shutil.copyfileobj(spool, f)
+        _forget(self._uploaded_news_cache, workspace_id)
+
+        return len(seen_ids)
@@ -1,10 +1,11 @@
-import json
+import os
+import secrets
 import shutil
-import uuid
 from datetime import datetime
 from pathlib import Path
 
 from app.models.workspace import WorkspaceMetadata
+from app.services.jsonio import dump_json, file_signature, load_model
 
 
 class WorkspaceNotFoundError(Exception):
@@ -19,9 +20,12 @@ class WorkspaceService:
     def __init__(self, workspaces_path: Path):
         self.workspaces_path = Path(workspaces_path)
         self.workspaces_path.mkdir(parents=True, exist_ok=True)
+        # Parsed metadata keyed by workspace dir, tagged with the file's
+        # (mtime_ns, size) so writes from other services are picked up.
+        self._metadata_cache: dict[Path, tuple[tuple[int, int], WorkspaceMetadata]] = {}
 
     def create_workspace(self, name: str) -> WorkspaceMetadata:
-        workspace_id = f"ws-{uuid.uuid4().hex[:8]}"
+        workspace_id = f"ws-{secrets.token_hex(4)}"
         workspace_dir = self.workspaces_path / workspace_id
 
         workspace_dir.mkdir()
@@ -41,11 +45,24 @@ class WorkspaceService:
 
     def list_workspaces(self) -> list[WorkspaceMetadata]:
         workspaces = []
-        for ws_dir in self.workspaces_path.iterdir():
-            if ws_dir.is_dir() and (ws_dir / "metadata.json").exists():
-                workspaces.append(self._load_metadata(ws_dir))
+        with os.scandir(self.workspaces_path) as entries:
+            for entry in entries:
+                ws_dir = Path(entry.path)
+                if entry.is_dir() and (ws_dir / "metadata.json").exists():
+                    workspaces.append(self._load_metadata(ws_dir))
         return sorted(workspaces, key=lambda w: w.created_at, reverse=True)
 
+    def get_workspace_dir(self, workspace_id: str) -> Path:
+        """Resolve a workspace's directory without loading its metadata."""
+        workspace_dir = self.workspaces_path / workspace_id
+        # Ids like "." or ".." must not resolve to the root or outside it.
+        if (
+            workspace_dir.resolve().parent != self.workspaces_path.resolve()
+            or not (workspace_dir / "metadata.json").is_file()
+        ):
+            raise WorkspaceNotFoundError(workspace_id)
+        return workspace_dir
+
     def get_workspace(self, workspace_id: str) -> WorkspaceMetadata:
         workspace_dir = self.workspaces_path / workspace_id
         if not workspace_dir.exists():
@@ -57,19 +74,25 @@ class WorkspaceService:
         if not workspace_dir.exists():
             raise WorkspaceNotFoundError(workspace_id)
         shutil.rmtree(workspace_dir)
+        self._metadata_cache.pop(workspace_dir, None)
 
     def _save_metadata(
         self, workspace_dir: Path, metadata: WorkspaceMetadata
     ) -> None:
-        with open(workspace_dir / "metadata.json", "w") as f:
-            json.dump(metadata.model_dump(mode="json"), f, indent=2)
+        dump_json(workspace_dir / "metadata.json", metadata.model_dump(mode="json"))
 
     def _load_metadata(self, workspace_dir: Path) -> WorkspaceMetadata:
-        with open(workspace_dir / "metadata.json") as f:
-            return WorkspaceMetadata.model_validate(json.load(f))
+        metadata_path = workspace_dir / "metadata.json"
+        signature = file_signature(metadata_path)
+
+        cached = self._metadata_cache.get(workspace_dir)
+        if cached is not None and cached[0] == signature:
+            return cached[1].model_copy()
+
+        metadata = load_model(metadata_path, WorkspaceMetadata)
+        self._metadata_cache[workspace_dir] = (signature, metadata)
+        return metadata.model_copy()
 
     def _init_empty_prompts(self, workspace_dir: Path) -> None:
-        with open(workspace_dir / "category_definitions.json", "w") as f:
-            json.dump({"categories": []}, f)
-        with open(workspace_dir / "few_shot_examples.json", "w") as f:
-            json.dump({"examples": []}, f)
+        dump_json(workspace_dir / "category_definitions.json", {"categories": []})
+        dump_json(workspace_dir / "few_shot_examples.json", {"examples": []})
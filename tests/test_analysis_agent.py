@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock
 
+import pytest
+
 
 def test_analysis_agent_builds_prompt():
     """AnalysisAgent builds prompt from all three dimensions."""
@@ -117,3 +119,193 @@ def test_analysis_agent_analyze_with_custom_prompt_returns_ai_insight_with_user_
     mock_llm.with_structured_output.assert_called_once_with(AIInsightWithUserAnalysis)
     assert isinstance(insight, AIInsightWithUserAnalysis)
     assert insight.user_requested_analysis == "Custom analysis result"
+
+
+def test_analysis_agent_returns_cached_insight_without_calling_llm():
+    """AnalysisAgent.analyze() serves repeated requests from the response cache."""
+    from app.agents.analysis_agent import AnalysisAgent
+    from app.agents.response_cache import ResponseCache
+    from app.models.feedback import AIInsight
+    from app.models.prompts import CategoryDefinition
+
+    mock_llm = MagicMock()
+    mock_structured_llm = MagicMock()
+    mock_llm.with_structured_output.return_value = mock_structured_llm
+    mock_structured_llm.invoke.return_value = AIInsight(
+        category="Cat1", reasoning_table=[], confidence=0.9
+    )
+
+    agent = AnalysisAgent(llm=mock_llm, system_prompt="sys", cache=ResponseCache())
+    categories = [CategoryDefinition(name="Cat1", definition="Definition 1")]
+
+    first = agent.analyze(categories, [], "article")
+    second = agent.analyze(categories, [], "article")
+    agent.analyze(categories, [], "another article")
+
+    assert first == second
+    assert first is not second
+    assert mock_structured_llm.invoke.call_count == 2
+
+
+def test_analysis_agent_analyze_batch_groups_articles_per_call():
+    """AnalysisAgent.analyze_batch() sends batch_size articles per LLM call."""
+    from app.agents.analysis_agent import AnalysisAgent
+    from app.models.feedback import AIInsight, AIInsightBatch
+    from app.models.prompts import CategoryDefinition
+
+    mock_llm = MagicMock()
+    mock_structured_llm = MagicMock()
+    mock_llm.with_structured_output.return_value = mock_structured_llm
+    insight = AIInsight(category="Cat1", reasoning_table=[], confidence=0.9)
+    mock_structured_llm.invoke.side_effect = [
+        AIInsightBatch(results=[insight, insight]),
+        AIInsightBatch(results=[insight]),
+    ]
+
+    agent = AnalysisAgent(llm=mock_llm, system_prompt="sys", batch_size=2)
+    categories = [CategoryDefinition(name="Cat1", definition="Definition 1")]
+
+    insights = agent.analyze_batch(categories, [], ["one", "two", "three"])
+
+    mock_llm.with_structured_output.assert_called_once_with(AIInsightBatch)
+    assert mock_structured_llm.invoke.call_count == 2
+    assert [i.category for i in insights] == ["Cat1", "Cat1", "Cat1"]
+    first_prompt = mock_structured_llm.invoke.call_args_list[0].args[0][1].content
+    assert "### Article 1\none" in first_prompt
+    assert "### Article 2\ntwo" in first_prompt
+    assert "three" not in first_prompt
+
+
+def test_analysis_agent_analyze_batch_rejects_result_count_mismatch():
+    """AnalysisAgent.analyze_batch() raises when the LLM drops an article."""
+    from app.agents.analysis_agent import AnalysisAgent
+    from app.models.feedback import AIInsight, AIInsightBatch
+    from app.models.prompts import CategoryDefinition
+
+    mock_llm = MagicMock()
+    mock_structured_llm = MagicMock()
+    mock_llm.with_structured_output.return_value = mock_structured_llm
+    mock_structured_llm.invoke.return_value = AIInsightBatch(
+        results=[AIInsight(category="Cat1", reasoning_table=[], confidence=0.9)]
+    )
+
+    agent = AnalysisAgent(llm=mock_llm, system_prompt="sys")
+    categories = [CategoryDefinition(name="Cat1", definition="Definition 1")]
+
+    with pytest.raises(ValueError):
+        agent.analyze_batch(categories, [], ["one", "two"])
+
+
+@pytest.mark.asyncio
+async def test_analysis_agent_analyze_many_runs_calls_concurrently():
+    """AnalysisAgent.analyze_many() overlaps LLM calls up to max_concurrency."""
+    import asyncio
+    from unittest.mock import AsyncMock
+
+    from app.agents.analysis_agent import AnalysisAgent
+    from app.models.feedback import AIInsight
+    from app.models.prompts import CategoryDefinition
+
+    in_flight = 0
+    peak = 0
+
+    async def fake_ainvoke(messages):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return AIInsight(category="Cat1", reasoning_table=[], confidence=0.9)
+
+    mock_llm = MagicMock()
+    mock_structured_llm = MagicMock()
+    mock_structured_llm.ainvoke = AsyncMock(side_effect=fake_ainvoke)
+    mock_llm.with_structured_output.return_value = mock_structured_llm
+
+    agent = AnalysisAgent(llm=mock_llm, system_prompt="sys", max_concurrency=2)
+    categories = [CategoryDefinition(name="Cat1", definition="Definition 1")]
+
+    insights = await agent.analyze_many(categories, [], ["a", "b", "c", "d"])
+
+    assert len(insights) == 4
+    assert mock_structured_llm.ainvoke.await_count == 4
+    assert peak == 2
+
+
+def test_analysis_agent_prefix_is_identical_across_articles():
+    """AnalysisAgent renders the same category/few-shot prefix for every article."""
+    from app.agents.analysis_agent import AnalysisAgent
+    from app.models.prompts import CategoryDefinition, FewShotExample
+
+    agent = AnalysisAgent(llm=MagicMock(), system_prompt="sys")
+    categories = [CategoryDefinition(name="Prefix", definition="Prefix definition")]
+    few_shots = [
+        FewShotExample(id="ex1", news_content="News", category="Prefix", reasoning="R"),
+    ]
+
+    first = agent._build_prompt(categories, few_shots, "Article one")
+    second = agent._build_prompt(categories, few_shots, "Article two")
+
+    assert first.split("## Article to Analyze")[0] == second.split("## Article to Analyze")[0]
+
+
+def test_analysis_agent_build_prompt_puts_article_last():
+    """AnalysisAgent keeps static blocks first and the article at the end."""
+    from app.agents.analysis_agent import AnalysisAgent
+    from app.models.prompts import CategoryDefinition
+
+    agent = AnalysisAgent(llm=MagicMock(), system_prompt="sys")
+    categories = [CategoryDefinition(name="Cat1", definition="Definition 1")]
+
+    prompt = agent._build_prompt(
+        categories, [], "Test article", custom_system_prompt="Extra instructions"
+    )
+
+    assert prompt.index("## Instructions") < prompt.index("## Additional Instructions")
+    assert prompt.index("## Additional Instructions") < prompt.index("## Article to Analyze")
+    assert prompt.rstrip().endswith("Test article")
+
+
+def test_analysis_agent_coerce_finds_overlapping_excerpts():
+    """Coercion scores each definition by the longest excerpt it contains, even when excerpts overlap."""
+    from app.agents.analysis_agent import AnalysisAgent
+    from app.models.feedback import AIInsight, ReasoningRow
+    from app.models.prompts import CategoryDefinition
+
+    agent = AnalysisAgent(llm=MagicMock(), system_prompt="sys")
+    categories = [
+        CategoryDefinition(name="A", definition="market news about earnings"),
+        CategoryDefinition(name="B", definition="market reports"),
+    ]
+    insight = AIInsight(
+        category="Unknown",
+        reasoning_table=[
+            ReasoningRow(category_excerpt="market", news_excerpt="x", reasoning="y"),
+            ReasoningRow(category_excerpt="ket news about", news_excerpt="x", reasoning="y"),
+        ],
+        confidence=0.5,
+    )
+
+    assert agent._coerce_category_from_excerpt(insight, categories) == "A"
+
+
+def test_analysis_agent_binds_structured_output_once_per_schema():
+    """AnalysisAgents built per request share one structured-output runnable per client."""
+    from app.agents.analysis_agent import AnalysisAgent
+    from app.models.feedback import AIInsight
+    from app.models.prompts import CategoryDefinition
+
+    mock_llm = MagicMock()
+    mock_structured_llm = MagicMock()
+    mock_llm.with_structured_output.return_value = mock_structured_llm
+    mock_structured_llm.invoke.return_value = AIInsight(
+        category="Cat1", reasoning_table=[], confidence=0.9
+    )
+
+    categories = [CategoryDefinition(name="Cat1", definition="Definition 1")]
+
+    AnalysisAgent(llm=mock_llm, system_prompt="sys").analyze(categories, [], "first")
+    AnalysisAgent(llm=mock_llm, system_prompt="sys").analyze(categories, [], "second")
+
+    mock_llm.with_structured_output.assert_called_once_with(AIInsight)
+    assert mock_structured_llm.invoke.call_count == 2
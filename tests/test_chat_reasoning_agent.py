@@ -1,5 +1,7 @@
 from unittest.mock import MagicMock
 
+import pytest
+
 
 def test_chat_reasoning_agent_builds_system_message():
     """ChatReasoningAgent includes all context in system message."""
@@ -107,5 +109,63 @@ def test_chat_reasoning_agent_stream_yields_tokens():
         message="Why?"
     ))
 
-    assert tokens == ["I ", "classified ", "this."]
+    assert tokens[0] == "I "
+    assert "".join(tokens) == "I classified this."
     mock_llm.stream.assert_called_once()
+
+
+def test_chat_reasoning_agent_stream_coalesces_chunks(monkeypatch):
+    """ChatReasoningAgent.stream flushes the first chunk, then batches of 16."""
+    from types import SimpleNamespace
+
+    from app.agents import chat_reasoning_agent
+    from app.agents.chat_reasoning_agent import ChatReasoningAgent
+    from app.models.feedback import AIInsight
+
+    monkeypatch.setattr(chat_reasoning_agent, "time", SimpleNamespace(monotonic=lambda: 100.0))
+
+    mock_llm = MagicMock()
+    mock_llm.stream.return_value = iter([MagicMock(content="x") for _ in range(20)])
+    agent = ChatReasoningAgent(llm=mock_llm)
+
+    tokens = list(agent.stream(
+        article_content="Test article",
+        categories=[],
+        few_shots=[],
+        ai_insight=AIInsight(category="Tech", reasoning_table=[], confidence=0.9),
+        chat_history=[],
+        message="Why?"
+    ))
+
+    assert [len(t) for t in tokens] == [1, 16, 3]
+
+
+@pytest.mark.asyncio
+async def test_chat_reasoning_agent_astream_yields_tokens():
+    """ChatReasoningAgent.astream yields tokens from the LLM's async stream."""
+    from app.agents.chat_reasoning_agent import ChatReasoningAgent
+    from app.models.feedback import AIInsight
+
+    async def fake_astream(messages):
+        for content in ("I ", "classified ", "this."):
+            yield MagicMock(content=content)
+
+    mock_llm = MagicMock()
+    mock_llm.astream = MagicMock(side_effect=fake_astream)
+    agent = ChatReasoningAgent(llm=mock_llm)
+
+    tokens = [
+        token
+        async for token in agent.astream(
+            article_content="Test article",
+            categories=[],
+            few_shots=[],
+            ai_insight=AIInsight(category="Tech", reasoning_table=[], confidence=0.9),
+            chat_history=[],
+            message="Why?",
+        )
+    ]
+
+    assert tokens[0] == "I "
+    assert "".join(tokens) == "I classified this."
+    mock_llm.stream.assert_not_called()
@@ -29,3 +29,35 @@ def test_config_loads_openrouter_settings(monkeypatch):
     assert settings.llm_provider == "openrouter"
     assert settings.openrouter_api_key == "test-key"
     assert settings.openrouter_model == "anthropic/claude-3.5-sonnet"
+
+
+def test_config_rejects_unknown_llm_provider(monkeypatch):
+    """Config rejects LLM_PROVIDER values outside the supported set."""
+    monkeypatch.setenv("LLM_PROVIDER", "unknown")
+    monkeypatch.setenv("NEWS_CSV_PATH", "./data/news.csv")
+    monkeypatch.setenv("WORKSPACES_PATH", "./data/workspaces")
+    monkeypatch.setenv("SYSTEM_PROMPT_PATH", "./prompts/system_prompt.txt")
+
+    from app.config import Settings
+    with pytest.raises(ValidationError):
+        Settings()
+
+
+def test_config_reads_system_prompt_once(monkeypatch, tmp_path):
+    """Config exposes paths as Path objects and caches the system prompt text."""
+    prompt_path = tmp_path / "system.txt"
+    prompt_path.write_text("Original prompt")
+    monkeypatch.setenv("LLM_PROVIDER", "openrouter")
+    monkeypatch.setenv("NEWS_CSV_PATH", "./data/news.csv")
+    monkeypatch.setenv("WORKSPACES_PATH", "./data/workspaces")
+    monkeypatch.setenv("SYSTEM_PROMPT_PATH", str(prompt_path))
+
+    from pathlib import Path
+
+    from app.config import Settings
+    settings = Settings()
+
+    assert isinstance(settings.workspaces_path, Path)
+    assert settings.system_prompt_text == "Original prompt"
+    prompt_path.write_text("Changed prompt")
+    assert settings.system_prompt_text == "Original prompt"
@@ -32,22 +32,72 @@ def test_evaluation_agent_builds_prompt():
     assert "Thumbs up: False" in prompt or "negative" in prompt.lower()
 
 
-def test_evaluation_agent_parses_response():
-    """EvaluationAgent parses LLM response into EvaluationReport."""
-    from app.agents.evaluation_agent import EvaluationAgent
+def test_evaluation_agent_evaluate_uses_structured_output():
+    """EvaluationAgent.evaluate() builds the report from structured LLM output."""
+    from app.agents.evaluation_agent import EvaluationAgent, EvaluationPayload
+    from app.models.feedback import AIInsight, Feedback, PromptGap
 
     mock_llm = MagicMock()
+    mock_structured_llm = MagicMock()
+    mock_llm.with_structured_output.return_value = mock_structured_llm
+    mock_structured_llm.invoke.return_value = EvaluationPayload(
+        diagnosis="Category definition unclear",
+        prompt_gaps=[PromptGap(location="Cat1", issue="Vague", suggestion="Clarify")],
+        summary="Improve Cat1 definition",
+    )
     agent = EvaluationAgent(llm=mock_llm)
 
-    raw_response = '''{
-        "diagnosis": "Category definition unclear",
-        "prompt_gaps": [{"location": "Cat1", "issue": "Vague", "suggestion": "Clarify"}],
-        "few_shot_gaps": [],
-        "summary": "Improve Cat1 definition"
-    }'''
+    feedback = Feedback(
+        id="fb-001",
+        article_id="news-001",
+        thumbs_up=False,
+        correct_category="Cat2",
+        reasoning="Wrong category",
+        ai_insight=AIInsight(category="Cat1", reasoning_table=[], confidence=0.8),
+        created_at=datetime.now(),
+    )
 
-    report = agent._parse_response("fb-001", raw_response)
+    report = agent.evaluate(feedback, [], [])
 
+    mock_llm.with_structured_output.assert_called_once_with(EvaluationPayload)
+    assert report.id.startswith("rpt-")
     assert report.feedback_id == "fb-001"
     assert report.diagnosis == "Category definition unclear"
     assert len(report.prompt_gaps) == 1
+    assert report.few_shot_gaps == []
+
+
+@pytest.mark.asyncio
+async def test_evaluation_agent_aevaluate_uses_async_llm():
+    """EvaluationAgent.aevaluate() awaits ainvoke on a structured LLM bound once."""
+    from unittest.mock import AsyncMock
+
+    from app.agents.evaluation_agent import EvaluationAgent, EvaluationPayload
+    from app.models.feedback import AIInsight, Feedback
+
+    mock_llm = MagicMock()
+    mock_structured_llm = MagicMock()
+    mock_structured_llm.ainvoke = AsyncMock(
+        return_value=EvaluationPayload(diagnosis="d", summary="s")
+    )
+    mock_llm.with_structured_output.return_value = mock_structured_llm
+    agent = EvaluationAgent(llm=mock_llm)
+
+    feedback = Feedback(
+        id="fb-001",
+        article_id="news-001",
+        thumbs_up=True,
+        correct_category="Cat1",
+        reasoning="Right",
+        ai_insight=AIInsight(category="Cat1", reasoning_table=[], confidence=0.8),
+        created_at=datetime.now(),
+    )
+
+    await agent.aevaluate(feedback, [], [])
+    report = await agent.aevaluate(feedback, [], [])
+
+    assert mock_structured_llm.ainvoke.await_count == 2
+    mock_structured_llm.invoke.assert_not_called()
+    mock_llm.with_structured_output.assert_called_once_with(EvaluationPayload)
+    assert report.feedback_id == "fb-001"
+    assert report.summary == "s"
@@ -97,3 +97,65 @@ def test_list_evaluation_reports(workspace_dir):
     reports = service.list_evaluation_reports()
 
     assert len(reports) == 2
+
+
+def test_delete_feedback_removes_its_evaluation_report(workspace_dir):
+    """FeedbackService finds and deletes only the report for the deleted feedback."""
+    from app.models.feedback import AIInsight, EvaluationReport, Feedback
+    from app.services.feedback_service import FeedbackService
+
+    service = FeedbackService(workspace_dir)
+    for i in range(2):
+        service.save_feedback(Feedback(
+            id=f"fb-{i:03d}",
+            article_id="news-001",
+            thumbs_up=True,
+            correct_category="Cat1",
+            reasoning="Good",
+            ai_insight=AIInsight(category="Cat1", reasoning_table=[], confidence=0.9),
+            created_at=datetime.now(),
+        ))
+        service.save_evaluation_report(EvaluationReport(
+            id=f"rpt-{i:03d}",
+            feedback_id=f"fb-{i:03d}",
+            diagnosis="Diagnosis",
+            prompt_gaps=[],
+            few_shot_gaps=[],
+            summary="Summary",
+        ))
+
+    assert service.get_evaluation_report_for_feedback("fb-001").id == "rpt-001"
+
+    service.delete_feedback("fb-001")
+
+    assert service.get_evaluation_report_for_feedback("fb-001") is None
+    assert service.get_evaluation_report_for_feedback("fb-000").id == "rpt-000"
+
+
+def test_evaluation_lookup_uses_status_index(workspace_dir):
+    """FeedbackService finds a feedback's report and failures without scanning reports."""
+    from unittest.mock import patch
+
+    from app.models.feedback import EvaluationReport
+    from app.services.feedback_service import FeedbackService
+
+    service = FeedbackService(workspace_dir)
+    service.mark_evaluation_pending("fb-000")
+    service.mark_evaluation_failed("fb-001", "LLM unavailable")
+    service.save_evaluation_report(EvaluationReport(
+        id="rpt-002",
+        feedback_id="fb-002",
+        diagnosis="Diagnosis",
+        prompt_gaps=[],
+        few_shot_gaps=[],
+        summary="Summary",
+    ))
+
+    with patch.object(service, "_find_evaluation_report_file") as scan:
+        assert service.get_evaluation_report_for_feedback("fb-000") is None
+        assert service.get_evaluation_error("fb-000") is None
+        assert service.get_evaluation_report_for_feedback("fb-001") is None
+        assert service.get_evaluation_error("fb-001") == "LLM unavailable"
+        assert service.get_evaluation_report_for_feedback("fb-002").id == "rpt-002"
+
+    scan.assert_not_called()
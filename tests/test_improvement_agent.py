@@ -338,3 +338,191 @@ def test_improvement_agent_keeps_synthetic_news_content():
 
     assert result.updated_few_shots[0].example.news_content == "LLM generated synthetic news content"
     assert result.updated_few_shots[0].source == "synthetic"
+
+
+@pytest.mark.asyncio
+async def test_improvement_agent_asuggest_improvements_streams_response():
+    """ImprovementAgent.asuggest_improvements() accumulates the LLM's async stream."""
+    from app.agents.improvement_agent import ImprovementAgent
+
+    async def fake_astream(messages):
+        for content in ('{"category_suggestions": [], ', '"priority_order": ["Nothing to fix"]}'):
+            yield MagicMock(content=content)
+
+    mock_llm = MagicMock()
+    mock_llm.astream = MagicMock(side_effect=fake_astream)
+    agent = ImprovementAgent(llm=mock_llm)
+
+    result = await agent.asuggest_improvements([], [], [])
+
+    mock_llm.astream.assert_called_once()
+    mock_llm.invoke.assert_not_called()
+    assert result.priority_order == ["Nothing to fix"]
+
+
+def test_improvement_agent_batches_groups_per_call():
+    """ImprovementAgent.suggest_improvements_batched() packs batch_size groups per LLM call."""
+    from app.agents.improvement_agent import ImprovementAgent
+    from app.models.prompts import CategoryDefinition
+
+    mock_llm = MagicMock()
+    mock_llm.invoke.side_effect = [
+        MagicMock(
+            content='{"results": ['
+            '{"group_id": 2, "category_suggestions": [{"category": "B", "suggested": "New B"}]},'
+            '{"group_id": 1, "category_suggestions": [{"category": "A", "suggested": "New A"}]}'
+            "]}"
+        ),
+        MagicMock(content='{"results": [{"group_id": 1, "priority_order": ["Fix C"]}]}'),
+    ]
+    agent = ImprovementAgent(llm=mock_llm, batch_size=2)
+    groups = [
+        ([], [CategoryDefinition(name=name, definition=f"Def {name}")], [])
+        for name in ("A", "B", "C")
+    ]
+
+    results = agent.suggest_improvements_batched(groups)
+
+    assert mock_llm.invoke.call_count == 2
+    first_prompt = mock_llm.invoke.call_args_list[0].args[0][1].content
+    assert "# Group 1" in first_prompt and "# Group 2" in first_prompt
+    assert "Def C" not in first_prompt
+    assert [r.updated_categories[0].category for r in results[:2]] == ["A", "B"]
+    assert results[2].priority_order == ["Fix C"]
+
+
+def test_improvement_agent_batch_rejects_missing_group():
+    """ImprovementAgent.suggest_improvements_batched() raises when a group result is missing."""
+    from app.agents.improvement_agent import ImprovementAgent
+
+    mock_llm = MagicMock()
+    mock_llm.invoke.return_value = MagicMock(content='{"results": [{"group_id": 1}]}')
+    agent = ImprovementAgent(llm=mock_llm)
+
+    with pytest.raises(ValueError):
+        agent.suggest_improvements_batched([([], [], []), ([], [], [])])
+
+
+def test_improvement_agent_batch_accepts_string_group_ids():
+    """ImprovementAgent.suggest_improvements_batched() matches "1"/1.0 ids and skips malformed items."""
+    from app.agents.improvement_agent import ImprovementAgent
+
+    mock_llm = MagicMock()
+    mock_llm.invoke.return_value = MagicMock(
+        content='{"results": ['
+        '{"group_id": "x"}, {"priority_order": ["No id"]},'
+        '{"group_id": "1", "priority_order": ["Fix A"]},'
+        '{"group_id": 2.0, "priority_order": ["Fix B"]}'
+        "]}"
+    )
+    agent = ImprovementAgent(llm=mock_llm)
+
+    results = agent.suggest_improvements_batched([([], [], []), ([], [], [])])
+
+    assert [r.priority_order for r in results] == [["Fix A"], ["Fix B"]]
+
+
+def test_improvement_agent_prompt_puts_feedback_after_definitions():
+    """ImprovementAgent keeps categories and few-shots ahead of the volatile feedback."""
+    from datetime import datetime
+
+    from app.agents.improvement_agent import ImprovementAgent
+    from app.models.feedback import AIInsight, FeedbackWithHeadline
+    from app.models.prompts import CategoryDefinition, FewShotExample
+
+    agent = ImprovementAgent(llm=MagicMock())
+    categories = [CategoryDefinition(name="Technology", definition="Tech news")]
+    few_shots = [
+        FewShotExample(id="ex-1", news_content="News", category="Technology", reasoning="Why")
+    ]
+
+    def feedback(fb_id: str) -> FeedbackWithHeadline:
+        return FeedbackWithHeadline(
+            id=fb_id,
+            article_id="news-001",
+            article_headline="Headline",
+            article_content="Content",
+            thumbs_up=True,
+            correct_category="Technology",
+            reasoning="Right",
+            ai_insight=AIInsight(category="Technology", reasoning_table=[], confidence=0.9),
+            created_at=datetime.now(),
+        )
+
+    first = agent._build_prompt([feedback("fb-001")], categories, few_shots)
+    second = agent._build_prompt([feedback("fb-002")], categories, few_shots)
+
+    prefix_end = first.index("## User Feedback")
+    assert first.index("## Current Few-Shot Examples") < prefix_end
+    assert first[:prefix_end] == second[:prefix_end]
+
+
+def test_improvement_agent_returns_cached_suggestion_without_calling_llm():
+    """ImprovementAgent.suggest_improvements() serves repeated bundles from the response cache."""
+    from app.agents.improvement_agent import ImprovementAgent
+    from app.agents.response_cache import ResponseCache
+    from app.models.prompts import CategoryDefinition
+
+    mock_llm = MagicMock()
+    mock_llm.stream.side_effect = lambda messages: iter(
+        [
+            MagicMock(content='{"category_suggestions": '),
+            MagicMock(content='[{"category": "Cat1", "suggested": "New"}]}'),
+        ]
+    )
+    agent = ImprovementAgent(llm=mock_llm, cache=ResponseCache())
+    categories = [CategoryDefinition(name="Cat1", definition="Def1")]
+
+    first = agent.suggest_improvements([], categories, [])
+    first.priority_order.append("mutated by caller")
+    second = agent.suggest_improvements([], categories, [])
+    agent.suggest_improvements([], [CategoryDefinition(name="Cat1", definition="Other")], [])
+
+    assert mock_llm.stream.call_count == 2
+    assert second.updated_categories[0].updated_definition == "New"
+    assert second.priority_order == []
+
+
+def test_improvement_agent_parses_fenced_response():
+    """ImprovementAgent strips markdown code fences around the JSON payload."""
+    from app.agents.improvement_agent import ImprovementAgent
+
+    agent = ImprovementAgent(llm=MagicMock())
+
+    for raw_response in (
+        '```json\n{"priority_order": ["Fix Cat1"]}\n```',
+        '  ```\n{"priority_order": ["Fix Cat1"]}```  ',
+        '```json{"priority_order": ["Fix Cat1"]}',
+    ):
+        result = agent._parse_response(raw_response, feedbacks=[])
+        assert result.priority_order == ["Fix Cat1"]
+
+
+def test_improvement_agent_truncates_long_article_content():
+    """ImprovementAgent keeps only the head and tail of very long articles."""
+    from datetime import datetime
+
+    from app.agents.improvement_agent import ImprovementAgent
+    from app.models.feedback import AIInsight, FeedbackWithHeadline
+
+    agent = ImprovementAgent(llm=MagicMock())
+    article = "HEAD" + "x" * 20000 + "TAIL"
+    feedbacks = [
+        FeedbackWithHeadline(
+            id="fb-001",
+            article_id="news-001",
+            article_headline="Headline",
+            article_content=article,
+            thumbs_up=True,
+            correct_category="Cat1",
+            reasoning="Right",
+            ai_insight=AIInsight(category="Cat1", reasoning_table=[], confidence=0.9),
+            created_at=datetime.now(),
+        )
+    ]
+
+    prompt = agent._build_prompt(feedbacks, [], [])
+
+    assert "HEAD" in prompt and "TAIL" in prompt
+    assert "[truncated]" in prompt
+    assert len(prompt) < 9000
@@ -0,0 +1,11 @@
+def test_dump_json_and_load_model_round_trip(tmp_path):
+    """dump_json writes indented JSON that load_model validates back into a model."""
+    from app.models.prompts import PromptConfig
+    from app.services.jsonio import dump_json, load_model
+
+    path = tmp_path / "data.json"
+    dump_json(path, {"categories": [{"name": "Cat1", "definition": "Déf"}]})
+
+    assert path.read_text().startswith('{\n  "categories"')
+    config = load_model(path, PromptConfig)
+    assert config.categories[0].definition == "Déf"
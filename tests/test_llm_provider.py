@@ -34,3 +34,41 @@ def test_get_llm_missing_api_key(monkeypatch):
 
     with pytest.raises(LLMConfigurationError):
         get_llm(settings)
+
+
+def test_get_llm_reuses_client_for_same_configuration(monkeypatch):
+    """LLMProvider returns the same client for identical settings."""
+    monkeypatch.setenv("LLM_PROVIDER", "openrouter")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setenv("NEWS_CSV_PATH", "./data/news.csv")
+    monkeypatch.setenv("WORKSPACES_PATH", "./data/workspaces")
+    monkeypatch.setenv("SYSTEM_PROMPT_PATH", "./prompts/system_prompt.txt")
+
+    from app.agents.llm_provider import get_llm
+    from app.config import Settings
+
+    first = get_llm(Settings())
+    second = get_llm(Settings())
+    monkeypatch.setenv("OPENROUTER_MODEL", "openai/gpt-4o")
+    other = get_llm(Settings())
+
+    assert first is second
+    assert other is not first
+
+
+def test_structured_output_is_bound_once_per_client_and_schema():
+    """structured_output() reuses the binding for a client and schema, and rebinds otherwise."""
+    from unittest.mock import MagicMock
+
+    from app.agents.llm_provider import structured_output
+    from app.models.feedback import AIInsight, AIInsightBatch
+
+    llm = MagicMock()
+    other_llm = MagicMock()
+
+    assert structured_output(llm, AIInsight) is structured_output(llm, AIInsight)
+    structured_output(llm, AIInsightBatch)
+    structured_output(other_llm, AIInsight)
+
+    assert llm.with_structured_output.call_count == 2
+    other_llm.with_structured_output.assert_called_once_with(AIInsight)
@@ -1,5 +1,7 @@
 from datetime import datetime
 
+import pytest
+
 
 def test_reasoning_row_creation():
     """ReasoningRow holds the 3-column reasoning data."""
@@ -195,3 +197,15 @@ def test_ai_insight_with_user_analysis_optional_field():
     )
 
     assert insight.user_requested_analysis is None
+
+
+def test_ai_insight_is_immutable():
+    """AIInsight rejects attribute assignment once constructed."""
+    from pydantic import ValidationError
+
+    from app.models.feedback import AIInsight
+
+    insight = AIInsight(category="Tech", reasoning_table=[], confidence=0.8)
+
+    with pytest.raises(ValidationError):
+        insight.category = "Finance"
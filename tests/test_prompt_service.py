@@ -96,3 +96,54 @@ def test_save_system_prompt(workspace_dir):
     loaded = service.get_system_prompt()
 
     assert loaded.content == "Explain why other categories were rejected"
+
+
+def test_get_categories_reparses_only_after_file_changes(workspace_dir):
+    """PromptService reuses a parsed config until the file on disk changes."""
+    from unittest.mock import patch
+
+    from app.services.jsonio import load_model
+    from app.services.prompt_service import PromptService
+
+    service = PromptService(workspace_dir)
+    with patch("app.services.prompt_service.load_model", wraps=load_model) as loader:
+        service.get_categories()
+        service.get_categories()
+
+    assert loader.call_count == 1
+
+    with open(workspace_dir / "category_definitions.json", "w") as f:
+        json.dump({"categories": [{"name": "Cat1", "definition": "Def 1"}]}, f)
+
+    assert [cat.name for cat in service.get_categories().categories] == ["Cat1"]
+
+
+def test_edits_to_returned_config_do_not_leak_into_cache(workspace_dir):
+    """PromptService hands out copies, so mutating one leaves later reads intact."""
+    from app.models.prompts import CategoryDefinition, PromptConfig
+    from app.services.prompt_service import PromptService
+
+    service = PromptService(workspace_dir)
+    saved = PromptConfig(categories=[CategoryDefinition(name="Cat1", definition="Def 1")])
+    service.save_categories(saved)
+    saved.categories.append(CategoryDefinition(name="Cat2", definition="Def 2"))
+
+    loaded = service.get_categories()
+    loaded.categories.clear()
+
+    assert [cat.name for cat in service.get_categories().categories] == ["Cat1"]
+
+
+def test_save_categories_writes_utf8(workspace_dir):
+    """PromptService writes configs as UTF-8 whatever the locale, so non-ASCII text round-trips."""
+    from app.models.prompts import CategoryDefinition, PromptConfig
+    from app.services.prompt_service import PromptService
+
+    service = PromptService(workspace_dir)
+    service.save_categories(
+        PromptConfig(categories=[CategoryDefinition(name="Café", definition="Über – naïve")])
+    )
+
+    raw = (workspace_dir / "category_definitions.json").read_bytes()
+    assert "Über – naïve" in raw.decode("utf-8")
+    assert PromptService(workspace_dir).get_categories().categories[0].name == "Café"
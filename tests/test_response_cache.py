@@ -0,0 +1,37 @@
+def test_make_cache_key_is_stable_and_separates_parts():
+    """make_cache_key returns the same key for the same parts only."""
+    from app.agents.response_cache import make_cache_key
+
+    assert make_cache_key("a", "b") == make_cache_key("a", "b")
+    assert make_cache_key("a", "b") != make_cache_key("ab", "")
+
+
+def test_response_cache_evicts_least_recently_used():
+    """ResponseCache drops the least recently used entry when full."""
+    from app.agents.response_cache import ResponseCache
+
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_response_cache_expires_entries(monkeypatch):
+    """ResponseCache treats entries older than the TTL as misses."""
+    from app.agents import response_cache
+    from app.agents.response_cache import ResponseCache
+
+    now = [100.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+
+    cache = ResponseCache(ttl_seconds=10)
+    cache.set("a", 1)
+    now[0] = 111.0
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
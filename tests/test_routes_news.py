@@ -54,3 +54,15 @@ def test_get_news_second_page(client):
 
     data = response.json()
     assert data["articles"][0]["id"] == "news-010"
+
+
+def test_get_news_revalidates_with_etag(client):
+    """GET /api/news answers 304 when If-None-Match carries the page's ETag."""
+    first = client.get("/api/news?page=1&limit=10")
+    etag = first.headers["etag"]
+
+    response = client.get("/api/news?page=1&limit=10", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    other_page = client.get("/api/news?page=2&limit=10", headers={"If-None-Match": etag})
+    assert other_page.status_code == 200
@@ -117,4 +117,37 @@ def test_get_system_prompt_after_save(client, workspace_id):
     response = client.get(f"/api/workspaces/{workspace_id}/prompts/system-prompt")
 
     assert response.status_code == 200
-    assert response.json()["content"] == "Custom instructions here"
\ No newline at end of file
+    assert response.json()["content"] == "Custom instructions here"
+
+
+def test_get_categories_revalidates_with_etag(client, workspace_id):
+    """GET categories sends an ETag and answers 304 until the categories change."""
+    url = f"/api/workspaces/{workspace_id}/prompts/categories"
+
+    first = client.get(url)
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    client.put(url, json={"categories": [{"name": "Cat1", "definition": "Definition 1"}]})
+
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+@pytest.mark.parametrize("encoded_id", ["%2E", "%2E%2E"])
+def test_dot_workspace_ids_are_rejected(client, tmp_path, encoded_id):
+    """Workspace ids "." and ".." are 404s and write nothing outside a workspace."""
+    categories = {"categories": [{"name": "Cat1", "definition": "Definition 1"}]}
+
+    put = client.put(f"/api/workspaces/{encoded_id}/prompts/categories", json=categories)
+    get = client.get(f"/api/workspaces/{encoded_id}/prompts/categories")
+
+    assert put.status_code == 404
+    assert get.status_code == 404
+    assert not (tmp_path / "category_definitions.json").exists()
+    assert not (tmp_path / "workspaces" / "category_definitions.json").exists()
@@ -1,5 +1,6 @@
 import csv
-from unittest.mock import MagicMock, patch
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -75,7 +76,7 @@ def test_analyze_article(client, workspace_id):
         mock_llm = MagicMock()
         mock_structured_llm = MagicMock()
         mock_llm.with_structured_output.return_value = mock_structured_llm
-        mock_structured_llm.invoke.return_value = mock_insight
+        mock_structured_llm.ainvoke = AsyncMock(return_value=mock_insight)
         mock_get_llm.return_value = mock_llm
 
         response = client.post(
@@ -90,20 +91,17 @@ def test_analyze_article(client, workspace_id):
 
 def test_submit_feedback(client, workspace_id):
     """POST /api/workspaces/{id}/feedback saves feedback and runs evaluation."""
-    mock_report = {
-        "diagnosis": "Test",
-        "prompt_gaps": [],
-        "few_shot_gaps": [],
-        "summary": "Test summary",
-    }
+    from app.agents.evaluation_agent import EvaluationPayload
+
+    mock_report = EvaluationPayload(diagnosis="Test", summary="Test summary")
 
     with patch("app.routes.workflows.get_llm") as mock_get_llm:
         mock_llm = MagicMock()
-        mock_llm.invoke.return_value.content = str(mock_report).replace("'", '"')
+        mock_llm.with_structured_output.return_value.ainvoke = AsyncMock(return_value=mock_report)
         mock_get_llm.return_value = mock_llm
 
         response = client.post(
-            f"/api/workspaces/{workspace_id}/feedback",
+            f"/api/workspaces/{workspace_id}/feedback?wait=true",
             json={
                 "article_id": "news-001",
                 "thumbs_up": True,
@@ -124,15 +122,13 @@ def test_submit_feedback(client, workspace_id):
 
 def test_chat_reasoning_streams_response(client, workspace_id):
     """POST /api/workspaces/{id}/chat-reasoning streams SSE tokens."""
-    mock_chunks = [
-        MagicMock(content="I "),
-        MagicMock(content="chose "),
-        MagicMock(content="Tech."),
-    ]
+    async def fake_astream(messages):
+        for content in ("I ", "chose ", "Tech."):
+            yield MagicMock(content=content)
 
     with patch("app.routes.workflows.get_llm") as mock_get_llm:
         mock_llm = MagicMock()
-        mock_llm.stream.return_value = iter(mock_chunks)
+        mock_llm.astream = MagicMock(side_effect=fake_astream)
         mock_get_llm.return_value = mock_llm
 
         response = client.post(
@@ -152,11 +148,13 @@ def test_chat_reasoning_streams_response(client, workspace_id):
     assert response.status_code == 200
     assert response.headers["content-type"] == "text/event-stream; charset=utf-8"
 
-    content = response.text
-    assert 'data: {"token": "I "}' in content
-    assert 'data: {"token": "chose "}' in content
-    assert 'data: {"token": "Tech."}' in content
-    assert 'data: {"done": true}' in content
+    events = [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+    assert "".join(e["token"] for e in events if "token" in e) == "I chose Tech."
+    assert events[-1] == {"done": True}
 
 
 def test_chat_reasoning_workspace_not_found(client):
@@ -195,19 +193,156 @@ def test_chat_reasoning_article_not_found(client, workspace_id):
     assert response.status_code == 404
 
 
+def test_submit_feedback_evaluates_in_background(client, workspace_id):
+    """POST /api/workspaces/{id}/feedback returns 202 and the report is fetched later."""
+    from app.agents.evaluation_agent import EvaluationPayload
+
+    mock_report = EvaluationPayload(diagnosis="Test", summary="Background summary")
+
+    with patch("app.routes.workflows.get_llm") as mock_get_llm:
+        mock_llm = MagicMock()
+        mock_llm.with_structured_output.return_value.ainvoke = AsyncMock(return_value=mock_report)
+        mock_get_llm.return_value = mock_llm
+
+        response = client.post(
+            f"/api/workspaces/{workspace_id}/feedback",
+            json={
+                "article_id": "news-001",
+                "thumbs_up": True,
+                "correct_category": "Cat1",
+                "reasoning": "Correct",
+                "ai_insight": {
+                    "category": "Cat1",
+                    "reasoning_table": [],
+                    "confidence": 0.9,
+                },
+            },
+        )
+
+    assert response.status_code == 202
+    feedback_id = response.json()["feedback_id"]
+
+    evaluation = client.get(f"/api/workspaces/{workspace_id}/feedback/{feedback_id}/evaluation")
+    assert evaluation.status_code == 200
+    assert evaluation.json()["summary"] == "Background summary"
+
+    missing = client.get(f"/api/workspaces/{workspace_id}/feedback/fb-missing/evaluation")
+    assert missing.status_code == 404
+
+
+def test_failed_background_evaluation_is_reported(client, workspace_id, caplog):
+    """GET .../evaluation reports a failed background evaluation instead of pending."""
+    with patch("app.routes.workflows.get_llm") as mock_get_llm:
+        mock_llm = MagicMock()
+        mock_llm.with_structured_output.return_value.ainvoke = AsyncMock(
+            side_effect=RuntimeError("LLM unavailable")
+        )
+        mock_get_llm.return_value = mock_llm
+
+        response = client.post(
+            f"/api/workspaces/{workspace_id}/feedback",
+            json={
+                "article_id": "news-001",
+                "thumbs_up": True,
+                "correct_category": "Cat1",
+                "reasoning": "Correct",
+                "ai_insight": {
+                    "category": "Cat1",
+                    "reasoning_table": [],
+                    "confidence": 0.9,
+                },
+            },
+        )
+
+    assert response.status_code == 202
+    feedback_id = response.json()["feedback_id"]
+
+    evaluation = client.get(f"/api/workspaces/{workspace_id}/feedback/{feedback_id}/evaluation")
+    assert evaluation.status_code == 200
+    assert evaluation.json() == {
+        "feedback_id": feedback_id,
+        "status": "failed",
+        "error": "RuntimeError",
+    }
+    assert "LLM unavailable" in caplog.text
+
+
+def test_pending_evaluation_returns_202(client, workspace_id, tmp_path):
+    """GET .../evaluation answers 202 while the evaluation is still running."""
+    from datetime import datetime
+
+    from app.models.feedback import AIInsight, Feedback
+    from app.services.feedback_service import FeedbackService
+
+    service = FeedbackService(tmp_path / "workspaces" / workspace_id)
+    service.save_feedback(Feedback(
+        id="fb-pending",
+        article_id="news-001",
+        thumbs_up=True,
+        correct_category="Cat1",
+        reasoning="Correct",
+        ai_insight=AIInsight(category="Cat1", reasoning_table=[], confidence=0.9),
+        created_at=datetime.now(),
+    ))
+    service.mark_evaluation_pending("fb-pending")
+
+    response = client.get(f"/api/workspaces/{workspace_id}/feedback/fb-pending/evaluation")
+
+    assert response.status_code == 202
+    assert response.json() == {"feedback_id": "fb-pending", "status": "pending"}
+
+
+def test_evaluation_of_deleted_feedback_is_not_saved(client, workspace_id, tmp_path):
+    """An evaluation that finishes after its feedback is deleted writes no files."""
+    from app.models.feedback import EvaluationReport
+    from app.services.feedback_service import FeedbackService
+
+    workspace_dir = tmp_path / "workspaces" / workspace_id
+
+    async def delete_then_evaluate(feedback, categories, few_shots):
+        FeedbackService(workspace_dir).delete_feedback(feedback.id)
+        return EvaluationReport(
+            id="rpt-late",
+            feedback_id=feedback.id,
+            diagnosis="Test",
+            prompt_gaps=[],
+            few_shot_gaps=[],
+            summary="Late summary",
+        )
+
+    with patch("app.routes.workflows.get_llm"), patch(
+        "app.routes.workflows.EvaluationAgent.aevaluate", side_effect=delete_then_evaluate
+    ):
+        response = client.post(
+            f"/api/workspaces/{workspace_id}/feedback",
+            json={
+                "article_id": "news-001",
+                "thumbs_up": True,
+                "correct_category": "Cat1",
+                "reasoning": "Correct",
+                "ai_insight": {
+                    "category": "Cat1",
+                    "reasoning_table": [],
+                    "confidence": 0.9,
+                },
+            },
+        )
+
+    assert response.status_code == 202
+    assert list((workspace_dir / "evaluation_reports").iterdir()) == []
+    assert list((workspace_dir / "evaluation_status").iterdir()) == []
+
+
 def test_feedback_with_headlines_includes_content(client, workspace_id):
     """GET /api/workspaces/{id}/feedback-with-headlines returns article_content."""
     # First submit feedback
-    mock_report = {
-        "diagnosis": "Test",
-        "prompt_gaps": [],
-        "few_shot_gaps": [],
-        "summary": "Test summary",
-    }
+    from app.agents.evaluation_agent import EvaluationPayload
+
+    mock_report = EvaluationPayload(diagnosis="Test", summary="Test summary")
 
     with patch("app.routes.workflows.get_llm") as mock_get_llm:
         mock_llm = MagicMock()
-        mock_llm.invoke.return_value.content = str(mock_report).replace("'", '"')
+        mock_llm.with_structured_output.return_value.ainvoke = AsyncMock(return_value=mock_report)
         mock_get_llm.return_value = mock_llm
 
         client.post(
@@ -233,6 +368,34 @@ def test_feedback_with_headlines_includes_content(client, workspace_id):
     assert data[0]["article_content"] == "Content"
 
 
+def test_list_feedback(client, workspace_id, tmp_path):
+    """GET /api/workspaces/{id}/feedback returns saved feedback as JSON."""
+    from datetime import datetime
+
+    from app.models.feedback import AIInsight, Feedback
+    from app.services.feedback_service import FeedbackService
+
+    FeedbackService(tmp_path / "workspaces" / workspace_id).save_feedback(
+        Feedback(
+            id="fb-1",
+            article_id="news-001",
+            thumbs_up=True,
+            correct_category="Cat1",
+            reasoning="Right",
+            ai_insight=AIInsight(category="Cat1", reasoning_table=[], confidence=0.9),
+            created_at=datetime(2026, 1, 1),
+        )
+    )
+
+    response = client.get(f"/api/workspaces/{workspace_id}/feedback")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    data = response.json()
+    assert [fb["id"] for fb in data] == ["fb-1"]
+    assert data[0]["created_at"] == "2026-01-01T00:00:00"
+
+
 def test_analyze_article_with_system_prompt(client, workspace_id):
     """POST /api/workspaces/{id}/analyze includes user_requested_analysis when system prompt set."""
     from app.models.feedback import AIInsightWithUserAnalysis
@@ -254,7 +417,7 @@ def test_analyze_article_with_system_prompt(client, workspace_id):
         mock_llm = MagicMock()
         # Mock with_structured_output to return a mock that returns our insight
         mock_structured_llm = MagicMock()
-        mock_structured_llm.invoke.return_value = mock_insight
+        mock_structured_llm.ainvoke = AsyncMock(return_value=mock_insight)
         mock_llm.with_structured_output.return_value = mock_structured_llm
         mock_get_llm.return_value = mock_llm
 
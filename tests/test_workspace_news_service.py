@@ -149,6 +149,24 @@ def test_upload_csv_duplicate_ids(workspaces_dir, workspace_with_metadata):
         service.upload_csv(workspace_with_metadata, file)
 
     assert "duplicate" in str(exc.value).lower()
+    assert not (workspaces_dir / workspace_with_metadata / "uploaded_news.csv").exists()
+    assert not file.closed
+
+
+def test_upload_csv_appends_after_existing_articles(workspaces_dir, workspace_with_metadata):
+    """upload_csv appends uploaded rows below articles already in the workspace CSV."""
+    from app.services.workspace_news_service import WorkspaceNewsService
+
+    service = WorkspaceNewsService(workspaces_dir, Path("/tmp/default.csv"))
+    existing = service.add_article(workspace_with_metadata, "Existing", "Content", "2026-01-01")
+
+    csv_content = "id,headline,content,date\n1,News One,\"Multi\nline\",2026-01-02\n"
+    count = service.upload_csv(workspace_with_metadata, io.BytesIO(csv_content.encode()))
+
+    articles = service._load_uploaded_news(workspace_with_metadata)
+    assert count == 1
+    assert [a.id for a in articles] == [existing.id, "1"]
+    assert articles[1].content == "Multi\nline"
 
 
 def test_get_news_source_default(workspaces_dir, workspace_with_metadata):
@@ -323,3 +341,108 @@ def test_get_article_replace_mode_excludes_default(
 
     with pytest.raises(ArticleNotFoundError):
         service.get_article(workspace_with_metadata, "default-0")
+
+
+def test_get_articles_bulk(workspaces_dir, workspace_with_metadata, default_news_csv):
+    """get_articles_bulk returns found articles by id and omits unknown ids."""
+    from app.services.workspace_news_service import WorkspaceNewsService
+
+    service = WorkspaceNewsService(workspaces_dir, default_news_csv)
+    added = service.add_article(workspace_with_metadata, "Uploaded", "Content", "2026-01-01")
+
+    articles = service.get_articles_bulk(
+        workspace_with_metadata, [added.id, "default-2", "nonexistent-id", "default-2"]
+    )
+
+    assert set(articles) == {added.id, "default-2"}
+    assert articles["default-2"].headline == "Default Headline 2"
+
+
+def test_default_news_is_parsed_once(workspaces_dir, workspace_with_metadata, default_news_csv):
+    """Default news articles are parsed once and shared across lookups."""
+    from app.services.workspace_news_service import WorkspaceNewsService
+
+    service = WorkspaceNewsService(workspaces_dir, default_news_csv)
+
+    first = service.get_article(workspace_with_metadata, "default-1")
+    second = service.get_article(workspace_with_metadata, "default-1")
+
+    assert first is second
+
+
+def test_get_article_prefers_uploaded_over_default_with_same_id(
+    workspaces_dir, workspace_with_metadata, default_news_csv
+):
+    """get_article returns the uploaded article when its id shadows a default one in merge mode."""
+    from app.services.workspace_news_service import WorkspaceNewsService
+
+    service = WorkspaceNewsService(workspaces_dir, default_news_csv)
+    service.upload_csv(
+        workspace_with_metadata,
+        io.BytesIO(b"id,headline,content,date\ndefault-0,Uploaded,Content,2026-01-01\n"),
+    )
+
+    assert service.get_article(workspace_with_metadata, "default-0").headline == "Uploaded"
+    assert service.get_article(workspace_with_metadata, "default-1").headline == "Default Headline 1"
+
+
+def test_uploaded_news_reparsed_only_after_change(
+    workspaces_dir, workspace_with_metadata, default_news_csv
+):
+    """Uploaded news and metadata are cached until the workspace files change."""
+    from unittest.mock import patch
+
+    from app.models.news import NewsSource
+    from app.services import workspace_news_service
+    from app.services.workspace_news_service import WorkspaceNewsService
+
+    service = WorkspaceNewsService(workspaces_dir, default_news_csv)
+    added = service.add_article(workspace_with_metadata, "Uploaded", "Content", "2026-01-01")
+    service.get_news(workspace_with_metadata, page=1, limit=10)
+
+    with patch.object(
+        workspace_news_service, "_read_news_csv", wraps=workspace_news_service._read_news_csv
+    ) as read_csv:
+        assert service.get_news(workspace_with_metadata, page=1, limit=10).total == 6
+        assert read_csv.call_count == 0
+
+        service.add_article(workspace_with_metadata, "Second", "Content", "2026-01-02")
+        service.set_news_source(workspace_with_metadata, NewsSource.REPLACE)
+
+        news = service.get_news(workspace_with_metadata, page=1, limit=10)
+        assert read_csv.call_count == 1
+        assert [a.id for a in news.articles][0] == added.id
+        assert news.total == 2
+
+
+def test_workspace_caches_are_bounded(
+    workspaces_dir, workspace_with_metadata, default_news_csv, monkeypatch
+):
+    """Per-workspace caches drop the least recently used workspace past their limit."""
+    import shutil
+
+    from app.services import workspace_news_service
+    from app.services.workspace_news_service import WorkspaceNewsService
+
+    monkeypatch.setattr(workspace_news_service, "_MAX_CACHED_WORKSPACES", 2)
+    for ws_id in ("ws-a", "ws-b"):
+        shutil.copytree(workspaces_dir / workspace_with_metadata, workspaces_dir / ws_id)
+
+    service = WorkspaceNewsService(workspaces_dir, default_news_csv)
+    for ws_id in (workspace_with_metadata, "ws-a", "ws-b"):
+        service.add_article(ws_id, "Uploaded", "Content", "2026-01-01")
+        service.get_news(ws_id, page=1, limit=10)
+
+    assert list(service._metadata_cache) == ["ws-a", "ws-b"]
+    assert list(service._uploaded_news_cache) == ["ws-a", "ws-b"]
+
+
+def test_loaded_metadata_is_a_copy(workspaces_dir, workspace_with_metadata):
+    """Editing returned metadata does not change what later reads see."""
+    from app.models.news import NewsSource
+    from app.services.workspace_news_service import WorkspaceNewsService
+
+    service = WorkspaceNewsService(workspaces_dir, workspaces_dir / "unused.csv")
+    service._load_metadata(workspace_with_metadata).news_source = NewsSource.REPLACE
+
+    assert service.get_news_source(workspace_with_metadata) == NewsSource.MERGE
@@ -80,3 +80,40 @@ def test_get_workspace_not_found(workspaces_dir):
 
     with pytest.raises(WorkspaceNotFoundError):
         service.get_workspace("nonexistent-id")
+
+
+def test_get_workspace_dir(workspaces_dir):
+    """WorkspaceService resolves an existing workspace directory and rejects unknown ids."""
+    from app.services.workspace_service import WorkspaceNotFoundError, WorkspaceService
+
+    service = WorkspaceService(workspaces_dir)
+    created = service.create_workspace("Test")
+
+    assert service.get_workspace_dir(created.id) == workspaces_dir / created.id
+    with pytest.raises(WorkspaceNotFoundError):
+        service.get_workspace_dir("nonexistent")
+
+
+def test_list_workspaces_reuses_parsed_metadata_until_file_changes(workspaces_dir):
+    """WorkspaceService re-reads metadata only after metadata.json is rewritten."""
+    import json
+    from unittest.mock import patch
+
+    from app.services.jsonio import load_model
+    from app.services.workspace_service import WorkspaceService
+
+    service = WorkspaceService(workspaces_dir)
+    created = service.create_workspace("Test")
+    service.list_workspaces()
+
+    with patch("app.services.workspace_service.load_model", wraps=load_model) as load:
+        service.list_workspaces()
+        assert load.call_count == 0
+
+        metadata_path = workspaces_dir / created.id / "metadata.json"
+        data = json.loads(metadata_path.read_text())
+        data["name"] = "Renamed workspace"
+        metadata_path.write_text(json.dumps(data))
+
+        assert service.list_workspaces()[0].name == "Renamed workspace"
+        assert load.call_count == 1